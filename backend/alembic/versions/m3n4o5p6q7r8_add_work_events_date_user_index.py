@@ -0,0 +1,27 @@
+"""Add composite index on work_events (date, user_id)
+
+Revision ID: m3n4o5p6q7r8
+Revises: l2m3n4o5p6q7
+Create Date: 2026-08-29
+
+Date-windowed distinct-user counts previously had to hit the table after
+the single-column date index; the composite index lets them be answered
+from an index-only scan.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "m3n4o5p6q7r8"
+down_revision = "l2m3n4o5p6q7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_work_events_date_user", "work_events", ["date", "user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_work_events_date_user", table_name="work_events")
@@ -0,0 +1,33 @@
+"""Add composite index on reports for the monthly analytics rollup
+
+Revision ID: n4o5p6q7r8s9
+Revises: m3n4o5p6q7r8
+Create Date: 2026-08-29
+
+The analytics queries group by hospital_domain, staff_group and month of
+shift_date but reports only indexed hospital_domain, forcing the date
+filter and sort into memory. A plain three-column index keeps the
+migration portable (a date_trunc expression index would be
+Postgres-only) and still gives the planner a range scan.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "n4o5p6q7r8s9"
+down_revision = "m3n4o5p6q7r8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_reports_hospital_month_group",
+        "reports",
+        ["hospital_domain", "shift_date", "staff_group"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reports_hospital_month_group", table_name="reports")
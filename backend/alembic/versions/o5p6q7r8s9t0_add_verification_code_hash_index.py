@@ -0,0 +1,31 @@
+"""Add index on verification_requests.code_hash
+
+Revision ID: o5p6q7r8s9t0
+Revises: n4o5p6q7r8s9
+Create Date: 2026-08-29
+
+The confirm endpoint matches codes in SQL (code_hash equality, optionally
+scoped by email_hash); the legacy code-only lookup had no index and
+scanned the table.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "o5p6q7r8s9t0"
+down_revision = "n4o5p6q7r8s9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_verification_requests_code_hash", "verification_requests", ["code_hash"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_verification_requests_code_hash", table_name="verification_requests"
+    )
@@ -0,0 +1,34 @@
+"""Add covering index for the recent-events dashboard query
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-08-29
+
+The admin dashboard's top-10 query (ORDER BY submitted_at DESC LIMIT 10)
+read the submitted_at index and then did a heap fetch per row. With the
+selected columns INCLUDEd, Postgres serves it (and the 24h count) as an
+index-only scan.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "p6q7r8s9t0u1"
+down_revision = "o5p6q7r8s9t0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_work_events_recent_cover",
+        "work_events",
+        [sa.text("submitted_at DESC")],
+        postgresql_include=["date", "planned_hours", "actual_hours", "source"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_work_events_recent_cover", table_name="work_events")
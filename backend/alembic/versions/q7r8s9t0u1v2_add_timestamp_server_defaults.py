@@ -0,0 +1,60 @@
+"""Add server-side defaults for timestamp columns
+
+Revision ID: q7r8s9t0u1v2
+Revises: p6q7r8s9t0u1
+Create Date: 2026-08-29
+
+Timestamp columns only had Python-side utcnow defaults, so any insert
+that bypasses the ORM (bulk helper, raw SQL, manual psql fixes) had to
+supply them explicitly. now() as a DDL default makes the schema
+self-sufficient; ORM inserts still send utcnow client-side, unchanged.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "q7r8s9t0u1v2"
+down_revision = "p6q7r8s9t0u1"
+branch_labels = None
+depends_on = None
+
+_TIMESTAMP_COLUMNS = [
+    ("verification_requests", "created_at"),
+    ("reports", "created_at"),
+    ("weekly_submissions", "created_at"),
+    ("users", "created_at"),
+    ("users", "updated_at"),
+    ("work_events", "submitted_at"),
+    ("finalized_user_weeks", "finalized_at"),
+    ("state_specialty_release_cells", "created_at"),
+    ("state_specialty_privacy_ledger", "recorded_at"),
+    ("user_privacy_ledger", "recorded_at"),
+    ("stats_by_state_specialty", "computed_at"),
+    ("stats_by_hospital", "computed_at"),
+    ("feedback_reports", "created_at"),
+    ("institution_inquiries", "created_at"),
+]
+
+
+def upgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(timezone=True),
+            server_default=None,
+            existing_nullable=False,
+        )
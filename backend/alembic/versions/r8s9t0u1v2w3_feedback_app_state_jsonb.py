@@ -0,0 +1,43 @@
+"""Convert feedback_reports.app_state to JSONB
+
+Revision ID: r8s9t0u1v2w3
+Revises: q7r8s9t0u1v2
+Create Date: 2026-08-29
+
+json stores text and reparses on every read; jsonb stores the parsed
+binary form, so admin dashboard reads skip the reparse and the column
+becomes GIN-indexable if report filtering is ever added.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision = "r8s9t0u1v2w3"
+down_revision = "q7r8s9t0u1v2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "feedback_reports",
+        "app_state",
+        existing_type=sa.JSON(),
+        type_=JSONB(),
+        existing_nullable=False,
+        postgresql_using="app_state::jsonb",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "feedback_reports",
+        "app_state",
+        existing_type=JSONB(),
+        type_=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using="app_state::json",
+    )
@@ -0,0 +1,40 @@
+"""Add status-filtered indexes for the admin feedback reports view
+
+Revision ID: s9t0u1v2w3x4
+Revises: r8s9t0u1v2w3
+Create Date: 2026-08-29
+
+/admin/reports?status=pending is the default admin view; without an
+index it scans and sorts the whole table. A partial index keeps the
+pending view O(log N + limit); a composite (resolved, created_at DESC)
+index covers the other status values.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "s9t0u1v2w3x4"
+down_revision = "r8s9t0u1v2w3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_feedback_reports_pending_recent",
+        "feedback_reports",
+        [sa.text("created_at DESC")],
+        postgresql_where=sa.text("resolved = 'pending'"),
+    )
+    op.create_index(
+        "ix_feedback_reports_resolved_recent",
+        "feedback_reports",
+        ["resolved", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_feedback_reports_resolved_recent", table_name="feedback_reports")
+    op.drop_index("ix_feedback_reports_pending_recent", table_name="feedback_reports")
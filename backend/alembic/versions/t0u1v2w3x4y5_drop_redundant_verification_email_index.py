@@ -0,0 +1,29 @@
+"""Drop the redundant email_hash index on verification_requests
+
+Revision ID: t0u1v2w3x4y5
+Revises: s9t0u1v2w3x4
+Create Date: 2026-08-29
+
+uq_verification_email_hash already backs every email_hash lookup (the
+table is one row per email), so the non-unique ix_ index on the same
+column only costs write amplification.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "t0u1v2w3x4y5"
+down_revision = "s9t0u1v2w3x4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_verification_requests_email_hash", table_name="verification_requests")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_verification_requests_email_hash", "verification_requests", ["email_hash"]
+    )
@@ -0,0 +1,43 @@
+"""Include user_id in the work_events covering index
+
+Revision ID: u1v2w3x4y5z6
+Revises: t0u1v2w3x4y5
+Create Date: 2026-08-29
+
+/dashboard/activity counts shifts and distinct contributors over a
+30-day submitted_at window. Adding user_id to the INCLUDE list of the
+existing covering index lets Postgres answer COUNT(DISTINCT user_id)
+with the same index-only scan that already serves the admin dashboard,
+so no second index is needed and scan cost tracks the window size, not
+the table size.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "u1v2w3x4y5z6"
+down_revision = "t0u1v2w3x4y5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_work_events_recent_cover", table_name="work_events")
+    op.create_index(
+        "ix_work_events_recent_cover",
+        "work_events",
+        [sa.text("submitted_at DESC")],
+        postgresql_include=["date", "planned_hours", "actual_hours", "source", "user_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_work_events_recent_cover", table_name="work_events")
+    op.create_index(
+        "ix_work_events_recent_cover",
+        "work_events",
+        [sa.text("submitted_at DESC")],
+        postgresql_include=["date", "planned_hours", "actual_hours", "source"],
+    )
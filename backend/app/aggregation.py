@@ -7,11 +7,11 @@ over finalized user-weeks.
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from datetime import date, datetime, timedelta
-from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import case, func, select
+from sqlalchemy import case, func, or_, select
 from sqlalchemy.orm import Session
 
 from .database import get_db
@@ -108,8 +108,65 @@ def _not_demo_user():
     )
 
 
-def _build_weekly_query(period_start: date, *, use_department_group: bool = False):
-    """Build aggregation query for a single week."""
+def _clipped_planned_sum():
+    return func.sum(case(
+        (FinalizedUserWeek.planned_hours < _BOUNDS.planned_weekly_min, _BOUNDS.planned_weekly_min),
+        (FinalizedUserWeek.planned_hours > _BOUNDS.planned_weekly_max, _BOUNDS.planned_weekly_max),
+        else_=FinalizedUserWeek.planned_hours,
+    )).label('clipped_planned_sum')
+
+
+def _clipped_actual_sum():
+    return func.sum(case(
+        (FinalizedUserWeek.actual_hours < _BOUNDS.actual_weekly_min, _BOUNDS.actual_weekly_min),
+        (FinalizedUserWeek.actual_hours > _BOUNDS.actual_weekly_max, _BOUNDS.actual_weekly_max),
+        else_=FinalizedUserWeek.actual_hours,
+    )).label('clipped_actual_sum')
+
+
+def _relevant_cell_filter(specialty_col, previous_period_start: date):
+    """SQL filter matching the cells the policy loop actually tracks.
+
+    Keeps groups that are either configured as enabled release cells or were
+    tracked in the previous period, so irrelevant groups are never
+    materialized (they used to be discarded in Python after the fact).
+    """
+    configured = (
+        select(StateSpecialtyReleaseCell.cell_id)
+        .where(
+            StateSpecialtyReleaseCell.is_enabled.is_(True),
+            StateSpecialtyReleaseCell.country_code == FinalizedUserWeek.country_code,
+            StateSpecialtyReleaseCell.state_code == FinalizedUserWeek.state_code,
+            StateSpecialtyReleaseCell.specialty == specialty_col,
+        )
+        .exists()
+    )
+    tracked = (
+        select(StatsByStateSpecialty.stat_id)
+        .where(
+            StatsByStateSpecialty.role_level == "all",
+            StatsByStateSpecialty.period_start == previous_period_start,
+            StatsByStateSpecialty.publication_status.in_(_TRACKED_INTERNAL_STATUSES),
+            StatsByStateSpecialty.country_code == FinalizedUserWeek.country_code,
+            StatsByStateSpecialty.state_code == FinalizedUserWeek.state_code,
+            StatsByStateSpecialty.specialty == specialty_col,
+        )
+        .exists()
+    )
+    return or_(configured, tracked)
+
+
+def _build_weekly_query(
+    period_start: date,
+    *,
+    use_department_group: bool = False,
+    previous_period_start: date | None = None,
+):
+    """Build aggregation query for a single week.
+
+    When previous_period_start is given, restricts to relevant cells in SQL
+    (see _relevant_cell_filter).
+    """
     specialty_col = FinalizedUserWeek.department_group if use_department_group else FinalizedUserWeek.specialty
     q = (
         select(
@@ -117,16 +174,8 @@ def _build_weekly_query(period_start: date, *, use_department_group: bool = Fals
             FinalizedUserWeek.state_code,
             specialty_col.label('specialty'),
             func.count(FinalizedUserWeek.user_id).label('n_users'),
-            func.sum(case(
-                (FinalizedUserWeek.planned_hours < _BOUNDS.planned_weekly_min, _BOUNDS.planned_weekly_min),
-                (FinalizedUserWeek.planned_hours > _BOUNDS.planned_weekly_max, _BOUNDS.planned_weekly_max),
-                else_=FinalizedUserWeek.planned_hours,
-            )).label('clipped_planned_sum'),
-            func.sum(case(
-                (FinalizedUserWeek.actual_hours < _BOUNDS.actual_weekly_min, _BOUNDS.actual_weekly_min),
-                (FinalizedUserWeek.actual_hours > _BOUNDS.actual_weekly_max, _BOUNDS.actual_weekly_max),
-                else_=FinalizedUserWeek.actual_hours,
-            )).label('clipped_actual_sum'),
+            _clipped_planned_sum(),
+            _clipped_actual_sum(),
         )
         .where(
             FinalizedUserWeek.week_start == period_start,
@@ -136,6 +185,8 @@ def _build_weekly_query(period_start: date, *, use_department_group: bool = Fals
     )
     if use_department_group:
         q = q.where(FinalizedUserWeek.department_group.isnot(None))
+    if previous_period_start is not None:
+        q = q.where(_relevant_cell_filter(specialty_col, previous_period_start))
     return q.group_by(
         FinalizedUserWeek.country_code,
         FinalizedUserWeek.state_code,
@@ -143,12 +194,53 @@ def _build_weekly_query(period_start: date, *, use_department_group: bool = Fals
     )
 
 
-def _build_multi_week_query(period_start: date, period_end: date, *, use_department_group: bool = False):
+def _build_weekly_range_query(range_start: date, range_end: date, *, use_department_group: bool = False):
+    """Grouped observed-cells scan spanning several weeks (backfill path).
+
+    Same row shape as _build_weekly_query plus the week_start key, so a
+    multi-week backfill issues one scan instead of one per week.
+    """
+    specialty_col = FinalizedUserWeek.department_group if use_department_group else FinalizedUserWeek.specialty
+    q = (
+        select(
+            FinalizedUserWeek.week_start,
+            FinalizedUserWeek.country_code,
+            FinalizedUserWeek.state_code,
+            specialty_col.label('specialty'),
+            func.count(FinalizedUserWeek.user_id).label('n_users'),
+            _clipped_planned_sum(),
+            _clipped_actual_sum(),
+        )
+        .where(
+            FinalizedUserWeek.week_start >= range_start,
+            FinalizedUserWeek.week_start <= range_end,
+            FinalizedUserWeek.hospital_ref_id.isnot(None),
+            _not_demo_user(),
+        )
+    )
+    if use_department_group:
+        q = q.where(FinalizedUserWeek.department_group.isnot(None))
+    return q.group_by(
+        FinalizedUserWeek.week_start,
+        FinalizedUserWeek.country_code,
+        FinalizedUserWeek.state_code,
+        specialty_col,
+    )
+
+
+def _build_multi_week_query(
+    period_start: date,
+    period_end: date,
+    *,
+    use_department_group: bool = False,
+    previous_period_start: date | None = None,
+):
     """Build aggregation query for multi-week periods (biweekly/monthly).
 
     Uses per-user mean across weeks in the period (clip each week first),
     then aggregates across users. Sensitivity is unchanged since each user's
-    mean is in [0, clip_max].
+    mean is in [0, clip_max]. When previous_period_start is given, restricts
+    to relevant cells in SQL (see _relevant_cell_filter).
     """
     specialty_col = FinalizedUserWeek.department_group if use_department_group else FinalizedUserWeek.specialty
     # CTE: per-user averages of clipped weekly values
@@ -160,6 +252,8 @@ def _build_multi_week_query(period_start: date, period_end: date, *, use_departm
     ]
     if use_department_group:
         cte_where.append(FinalizedUserWeek.department_group.isnot(None))
+    if previous_period_start is not None:
+        cte_where.append(_relevant_cell_filter(specialty_col, previous_period_start))
 
     user_avgs = (
         select(
@@ -299,11 +393,16 @@ def _check_dominance(
     """Return True if a single user dominates the cell (should be suppressed)."""
     if not per_user_actual:
         return False
-    clipped = [_BOUNDS.clip_actual(hours) for _, hours in per_user_actual]
-    total = sum(clipped)
+    total = 0.0
+    largest = 0.0
+    for _, hours in per_user_actual:
+        clipped = _BOUNDS.clip_actual(hours)
+        total += clipped
+        if clipped > largest:
+            largest = clipped
     if total == 0:
         return False
-    return max(clipped) / total > threshold
+    return largest / total > threshold
 
 
 def _compute_year_to_date_spending(db: Session, *, year: int) -> float:
@@ -326,6 +425,7 @@ def compute_aggregates_by_state_specialty(
     target_date: date | None = None,
     *,
     period_type: PeriodType = "weekly",
+    _observed_rows: list[Any] | None = None,
 ) -> int:
     """
     Compute aggregated statistics by state × specialty × period.
@@ -341,6 +441,8 @@ def compute_aggregates_by_state_specialty(
         db: Database session
         target_date: Date to aggregate around (defaults to yesterday)
         period_type: Aggregation granularity ("weekly", "biweekly", "monthly")
+        _observed_rows: Pre-fetched observed group rows for this period
+            (backfill path — skips the per-period grouped scan)
 
     Returns:
         Number of statistics records created
@@ -351,16 +453,36 @@ def compute_aggregates_by_state_specialty(
     period_start, period_end = get_period_bounds(target_date, period_type)
     previous_period_start = period_before(period_start, period_type)
 
-    print(f"Aggregating for period {period_start} to {period_end} (type={period_type})")
+    logger.info("Aggregating for period %s to %s (type=%s)", period_start, period_end, period_type)
 
     # Build the appropriate query
     use_dept_group = _V1_CONFIG.use_department_group
-    if period_type == "weekly":
-        query = _build_weekly_query(period_start, use_department_group=use_dept_group)
+    if _observed_rows is not None:
+        results = _observed_rows
+        observed_total = len(results)
+    elif period_type == "weekly":
+        query = _build_weekly_query(
+            period_start,
+            use_department_group=use_dept_group,
+            previous_period_start=previous_period_start,
+        )
+        unfiltered_query = _build_weekly_query(period_start, use_department_group=use_dept_group)
     else:
-        query = _build_multi_week_query(period_start, period_end, use_department_group=use_dept_group)
-
-    results = db.execute(query).all()
+        query = _build_multi_week_query(
+            period_start,
+            period_end,
+            use_department_group=use_dept_group,
+            previous_period_start=previous_period_start,
+        )
+        unfiltered_query = _build_multi_week_query(period_start, period_end, use_department_group=use_dept_group)
+
+    if _observed_rows is None:
+        results = db.execute(query).all()
+        # Cheap scalar count keeps the suppression metric without
+        # materializing the irrelevant groups themselves.
+        observed_total = db.execute(
+            select(func.count()).select_from(unfiltered_query.subquery())
+        ).scalar() or 0
     observed_by_cell = {
         _cell_key(
             country_code=row.country_code,
@@ -409,12 +531,28 @@ def compute_aggregates_by_state_specialty(
         ): row
         for row in previous_rows
     }
-    ignored_observed_cells = set(observed_by_cell) - configured_cells
+    existing_rows = (
+        db.query(StatsByStateSpecialty)
+        .filter(
+            StatsByStateSpecialty.role_level == "all",
+            StatsByStateSpecialty.period_start == period_start,
+        )
+        .all()
+    )
+    existing_by_cell = {
+        _cell_key(
+            country_code=row.country_code,
+            state_code=row.state_code,
+            specialty=row.specialty,
+        ): row
+        for row in existing_rows
+    }
+    ignored_observed_count = observed_total - len(results)
     relevant_cells = configured_cells | set(previous_by_cell)
 
-    print(f"Found {len(results)} groups before k-anonymity filter")
-    if ignored_observed_cells:
-        print(f"Ignoring {len(ignored_observed_cells)} unconfigured observed groups")
+    logger.info("Found %d groups before k-anonymity filter", len(results))
+    if ignored_observed_count:
+        logger.info("Ignoring %d unconfigured observed groups", ignored_observed_count)
 
     # Compute adaptive epsilon for this period
     year = period_start.year
@@ -460,6 +598,7 @@ def compute_aggregates_by_state_specialty(
     stats_created = 0
 
     per_user_data_by_cell: dict[tuple[str, str, str], list[tuple[Any, float]]] = {}
+    new_stats: list[StatsByStateSpecialty] = []
 
     for cell in sorted(relevant_cells):
         row: Any | None = observed_by_cell.get(cell)
@@ -499,17 +638,7 @@ def compute_aggregates_by_state_specialty(
             activation_weeks=_RELEASE_POLICY.activation_weeks,
             deactivation_grace_weeks=_RELEASE_POLICY.deactivation_grace_weeks,
         )
-        existing = (
-            db.query(StatsByStateSpecialty)
-            .filter(
-                StatsByStateSpecialty.country_code == cell[0],
-                StatsByStateSpecialty.state_code == cell[1],
-                StatsByStateSpecialty.specialty == cell[2],
-                StatsByStateSpecialty.role_level == "all",
-                StatsByStateSpecialty.period_start == period_start,
-            )
-            .one_or_none()
-        )
+        existing = existing_by_cell.get(cell)
         existing_ledger = ledger_by_cell.get(cell)
         needs_noise = status in {PublicationStatus.published, PublicationStatus.cooling_down}
         reuse_existing_release = (
@@ -532,7 +661,7 @@ def compute_aggregates_by_state_specialty(
             actual_ci_half = None if existing.actual_ci_half is None else float(existing.actual_ci_half)
             overtime_ci_half = None if existing.overtime_ci_half is None else float(existing.overtime_ci_half)
             n_display = existing.n_display
-            print(f"  Reusing existing {status.value} release: {cell[1]}/{cell[2]}")
+            logger.debug("Reusing existing %s release: %s/%s", status.value, cell[1], cell[2])
         elif needs_noise:
             avg_planned = planned_sum / n_users if n_users else 0.0
             avg_actual = actual_sum / n_users if n_users else 0.0
@@ -554,14 +683,15 @@ def compute_aggregates_by_state_specialty(
                 )
                 overtime_ci_half = planned_ci_half + actual_ci_half  # Conservative (triangle inequality)
 
-            print(f"  {status.value.title()} group (n={n_users}): {cell[1]}/{cell[2]}")
-            print(f"    Planned: {avg_planned:.2f} → {avg_planned_noised:.2f}")
-            print(f"    Actual: {avg_actual:.2f} → {avg_actual_noised:.2f}")
+            logger.debug(
+                "%s group (n=%d): %s/%s planned %.2f -> %.2f, actual %.2f -> %.2f",
+                status.value, n_users, cell[1], cell[2],
+                avg_planned, avg_planned_noised, avg_actual, avg_actual_noised,
+            )
         else:
-            print(
-                f"  Tracking group as {status.value} "
-                f"(n={n_users}, eligible_streak={consecutive_eligible}, ineligible_streak={consecutive_ineligible}): "
-                f"{cell[1]}/{cell[2]}"
+            logger.debug(
+                "Tracking group as %s (n=%d, eligible_streak=%d, ineligible_streak=%d): %s/%s",
+                status.value, n_users, consecutive_eligible, consecutive_ineligible, cell[1], cell[2],
             )
 
         effective_epsilon = adaptive_eps
@@ -569,21 +699,21 @@ def compute_aggregates_by_state_specialty(
         if existing and not reuse_existing_release:
             # Update existing record
             existing.n_users = n_users
-            existing.avg_planned_hours_noised = None if avg_planned_noised is None else Decimal(str(round(avg_planned_noised, 2)))
-            existing.avg_actual_hours_noised = None if avg_actual_noised is None else Decimal(str(round(avg_actual_noised, 2)))
-            existing.avg_overtime_hours_noised = None if avg_overtime_noised is None else Decimal(str(round(avg_overtime_noised, 2)))
+            existing.avg_planned_hours_noised = None if avg_planned_noised is None else round(avg_planned_noised, 2)
+            existing.avg_actual_hours_noised = None if avg_actual_noised is None else round(avg_actual_noised, 2)
+            existing.avg_overtime_hours_noised = None if avg_overtime_noised is None else round(avg_overtime_noised, 2)
             existing.publication_status = status.value
             existing.k_min_threshold = K_MIN
-            existing.noise_epsilon = Decimal(str(round(effective_epsilon, 2)))
+            existing.noise_epsilon = round(effective_epsilon, 2)
             existing.computed_at = datetime.utcnow()
             existing.period_type = period_type
-            existing.planned_ci_half = None if planned_ci_half is None else Decimal(str(round(planned_ci_half, 2)))
-            existing.actual_ci_half = None if actual_ci_half is None else Decimal(str(round(actual_ci_half, 2)))
-            existing.overtime_ci_half = None if overtime_ci_half is None else Decimal(str(round(overtime_ci_half, 2)))
+            existing.planned_ci_half = None if planned_ci_half is None else round(planned_ci_half, 2)
+            existing.actual_ci_half = None if actual_ci_half is None else round(actual_ci_half, 2)
+            existing.overtime_ci_half = None if overtime_ci_half is None else round(overtime_ci_half, 2)
             existing.n_display = n_display
             if use_dept_group:
                 existing.department_group = cell[2]
-            print(f"    Updated existing stat record")
+            logger.debug("Updated existing stat record")
         elif existing is None:
             # Create new record
             stat = StatsByStateSpecialty(
@@ -595,22 +725,22 @@ def compute_aggregates_by_state_specialty(
                 period_start=period_start,
                 period_end=period_end,
                 n_users=n_users,
-                avg_planned_hours_noised=None if avg_planned_noised is None else Decimal(str(round(avg_planned_noised, 2))),
-                avg_actual_hours_noised=None if avg_actual_noised is None else Decimal(str(round(avg_actual_noised, 2))),
-                avg_overtime_hours_noised=None if avg_overtime_noised is None else Decimal(str(round(avg_overtime_noised, 2))),
+                avg_planned_hours_noised=None if avg_planned_noised is None else round(avg_planned_noised, 2),
+                avg_actual_hours_noised=None if avg_actual_noised is None else round(avg_actual_noised, 2),
+                avg_overtime_hours_noised=None if avg_overtime_noised is None else round(avg_overtime_noised, 2),
                 publication_status=status.value,
                 k_min_threshold=K_MIN,
-                noise_epsilon=Decimal(str(round(effective_epsilon, 2))),
+                noise_epsilon=round(effective_epsilon, 2),
                 period_type=period_type,
-                planned_ci_half=None if planned_ci_half is None else Decimal(str(round(planned_ci_half, 2))),
-                actual_ci_half=None if actual_ci_half is None else Decimal(str(round(actual_ci_half, 2))),
-                overtime_ci_half=None if overtime_ci_half is None else Decimal(str(round(overtime_ci_half, 2))),
+                planned_ci_half=None if planned_ci_half is None else round(planned_ci_half, 2),
+                actual_ci_half=None if actual_ci_half is None else round(actual_ci_half, 2),
+                overtime_ci_half=None if overtime_ci_half is None else round(overtime_ci_half, 2),
                 n_display=n_display,
             )
-            db.add(stat)
-            print(f"    Created new stat record")
+            new_stats.append(stat)
+            logger.debug("Created new stat record")
         else:
-            print(f"    Preserved existing published stat record")
+            logger.debug("Preserved existing published stat record")
 
         if needs_noise:
             if not reuse_existing_release:
@@ -634,20 +764,73 @@ def compute_aggregates_by_state_specialty(
             if status == PublicationStatus.published:
                 stats_created += 1
 
+    if new_stats:
+        db.add_all(new_stats)
     db.commit()
 
-    print(f"\nAggregation complete:")
-    print(f"  Total observed groups: {len(results)}")
-    print(f"  Total tracked cells: {len(relevant_cells)}")
-    print(f"  Published: {stats_created}")
-    print(f"  Non-public: {len(relevant_cells) - stats_created}")
-    print(f"  Adaptive ε: {adaptive_eps:.4f} (YTD spend: {spent_ytd:.4f})")
+    logger.info(
+        "Aggregation complete: observed=%d, tracked=%d, published=%d, non_public=%d, "
+        "adaptive_eps=%.4f (YTD spend: %.4f)",
+        observed_total, len(relevant_cells), stats_created,
+        len(relevant_cells) - stats_created, adaptive_eps, spent_ytd,
+    )
 
     return stats_created
 
 
+def backfill_aggregates_by_state_specialty(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    *,
+    period_type: PeriodType = "weekly",
+) -> int:
+    """
+    Backfill aggregates for every period overlapping [start_date, end_date].
+
+    For weekly aggregation the observed groups for the whole range are
+    fetched with a single grouped scan keyed by week_start instead of one
+    scan per week. Periods still run oldest-first because streak tracking
+    and the adaptive ε schedule depend on previously recorded periods.
+
+    Returns:
+        Total number of published statistics records across all periods
+    """
+    use_dept_group = _V1_CONFIG.use_department_group
+
+    rows_by_period: dict[date, list[Any]] | None = None
+    if period_type == "weekly":
+        range_start, _ = get_period_bounds(start_date, period_type)
+        range_rows = db.execute(
+            _build_weekly_range_query(range_start, end_date, use_department_group=use_dept_group)
+        ).all()
+        rows_by_period = defaultdict(list)
+        for row in range_rows:
+            rows_by_period[row.week_start].append(row)
+
+    total_published = 0
+    period_start, period_end = get_period_bounds(start_date, period_type)
+    while period_start <= end_date:
+        observed = None if rows_by_period is None else rows_by_period.get(period_start, [])
+        total_published += compute_aggregates_by_state_specialty(
+            db,
+            period_start,
+            period_type=period_type,
+            _observed_rows=observed,
+        )
+        period_start, period_end = get_period_bounds(period_end + timedelta(days=1), period_type)
+
+    return total_published
+
+
 def main():
-    """Run aggregation for yesterday's ISO week."""
+    """Run aggregation for yesterday's ISO week (pass --verbose for per-cell logs)."""
+    import sys
+
+    logging.basicConfig(
+        level=logging.DEBUG if "--verbose" in sys.argv[1:] else logging.INFO,
+        format="%(message)s",
+    )
     db = next(get_db())
     try:
         stats_created = compute_aggregates_by_state_specialty(db)
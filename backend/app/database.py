@@ -1,6 +1,7 @@
 from collections.abc import Generator
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from .config import get_settings
@@ -8,17 +9,40 @@ from .models import Base
 
 settings = get_settings()
 
+_is_sqlite = settings.database.url.startswith("sqlite")
+
 connect_args: dict[str, object] = {}
-if settings.database.url.startswith("sqlite"):
+engine_kwargs: dict[str, object] = {}
+if _is_sqlite:
     connect_args["check_same_thread"] = False
+else:
+    # Sized for one uvicorn worker against the production Postgres.
+    engine_kwargs.update(pool_size=20, max_overflow=10, pool_recycle=3600)
 
 engine = create_engine(
     settings.database.url,
     pool_pre_ping=True,
     future=True,
     connect_args=connect_args,
+    # orjson for JSON columns (feedback_reports.app_state carries multi-KB
+    # app snapshots per write).
+    json_serializer=lambda obj: orjson.dumps(obj).decode("utf-8"),
+    json_deserializer=orjson.loads,
+    **engine_kwargs,
 )
 
+if _is_sqlite:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        """WAL + synchronous=NORMAL: fsync per checkpoint, not per commit."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        # Match Postgres FK semantics (ON DELETE CASCADE relies on this)
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 SessionLocal = sessionmaker(
     bind=engine,
     class_=Session,
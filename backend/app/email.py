@@ -1,5 +1,6 @@
 import logging
 import smtplib
+import threading
 from email.message import EmailMessage
 
 from .config import get_settings
@@ -7,33 +8,83 @@ from .config import get_settings
 settings = get_settings()
 logger = logging.getLogger("email")
 
+# SMTP settings flattened to module constants at import: send paths and
+# reconnects otherwise dot through the pydantic model on every call, and
+# these values never change at runtime.
+if settings.email is not None:
+    _SMTP_HOST = settings.email.smtp_host
+    _SMTP_PORT = settings.email.smtp_port
+    _SMTP_USE_TLS = settings.email.use_tls
+    _SMTP_USERNAME = settings.email.smtp_username
+    _SMTP_PASSWORD = settings.email.smtp_password
+    _FROM_ADDRESS = str(settings.email.from_address)
+    _NOTIFICATION_RECIPIENT = str(
+        settings.email.notification_email or settings.email.from_address
+    )
+
+# One authenticated SMTP session reused across sends: EHLO + STARTTLS +
+# EHLO + LOGIN costs several round-trips before the first payload byte,
+# which dominates latency during verification bursts. Guarded by a lock
+# since sends can come from concurrent request threads.
+_smtp_lock = threading.Lock()
+_smtp_connection: smtplib.SMTP | None = None
+
+
+def _open_smtp_connection() -> smtplib.SMTP:
+    smtp = smtplib.SMTP(_SMTP_HOST, _SMTP_PORT, timeout=30)
+    # Never enable debuglevel: its output includes message bodies and
+    # would leak plaintext verification codes to container logs.
+    smtp.set_debuglevel(0)
+    smtp.ehlo()
+    if _SMTP_USE_TLS:
+        smtp.starttls()
+        smtp.ehlo()
+    smtp.login(_SMTP_USERNAME, _SMTP_PASSWORD)
+    return smtp
+
+
+def _discard_smtp_connection(smtp: smtplib.SMTP) -> None:
+    try:
+        smtp.close()
+    except Exception:  # noqa: BLE001
+        pass
+
 
 def send_email(recipient: str, subject: str, body: str) -> None:
     """
     Sends an email if SMTP credentials are configured.
     Falls back to logging to stdout when email settings are absent.
+
+    Blocks on SMTP round-trips — request handlers should enqueue sends
+    via FastAPI BackgroundTasks (as /verification/request does) so the
+    response is not held up by mail delivery.
     """
     if settings.email is None:
         print(f"[email-placeholder] To: {recipient} Subject: {subject} Body: {body}")  # noqa: T201
         return
 
-    email_config = settings.email
     message = EmailMessage()
     message["Subject"] = subject
-    message["From"] = email_config.from_address
+    message["From"] = _FROM_ADDRESS
     message["To"] = recipient
     message.set_content(body)
 
+    global _smtp_connection
     try:
-        with smtplib.SMTP(email_config.smtp_host, email_config.smtp_port, timeout=30) as smtp:
-            smtp.set_debuglevel(0)
-            smtp.ehlo()
-            if email_config.use_tls:
-                smtp.starttls()
-                smtp.ehlo()
-            smtp.login(email_config.smtp_username, email_config.smtp_password)
-            smtp.send_message(message)
-            logger.info("Sent email to %s with subject: %s", recipient, subject)
+        with _smtp_lock:
+            smtp = _smtp_connection
+            _smtp_connection = None
+            if smtp is None:
+                smtp = _open_smtp_connection()
+            try:
+                smtp.send_message(message)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException):
+                # Server dropped the idle session — reconnect and retry once.
+                _discard_smtp_connection(smtp)
+                smtp = _open_smtp_connection()
+                smtp.send_message(message)
+            _smtp_connection = smtp
+        logger.info("Sent email to %s with subject: %s", recipient, subject)
     except Exception:  # noqa: BLE001
         logger.exception("Failed to send email")
         raise
@@ -56,7 +107,7 @@ def send_inquiry_notification(
         print(f"[email-placeholder] New inquiry #{inquiry_id} from {name} ({organization})")  # noqa: T201
         return
 
-    recipient = settings.email.notification_email or settings.email.from_address
+    recipient = _NOTIFICATION_RECIPIENT
     subject = f"[OWH] New Institution Inquiry from {organization}"
 
     body = f"""New inquiry submitted via the public dashboard.
@@ -82,6 +133,18 @@ View all inquiries at: https://api.openworkinghours.org/admin
         logger.exception("Failed to send inquiry notification email")
 
 
+# Static part of the verification body, built once. The code comes FIRST
+# so it's visible in email preview (~100 chars); bilingual instructions
+# follow. Only the code line varies per send.
+_VERIFY_BODY_SUFFIX = (
+    "\n\n"
+    "Use this code to log in. Valid for 15 minutes.\n"
+    "Verwenden Sie diesen Code zum Anmelden. Gültig für 15 Minuten.\n\n"
+    "If you did not request this, you can ignore this email.\n"
+    "Falls Sie dies nicht angefordert haben, können Sie diese E-Mail ignorieren.\n"
+)
+
+
 def send_verification_email(recipient: str, content: str, subject: str | None = None) -> None:
     """
     Sends a verification email if SMTP credentials are configured.
@@ -95,17 +158,9 @@ def send_verification_email(recipient: str, content: str, subject: str | None =
     default_subject = "Verify your hospital affiliation"
     email_subject = subject or default_subject
 
-    # For verification emails, wrap content in standard body
-    # Code appears FIRST so it's visible in email preview (~100 chars)
-    # Bilingual: first line works for both EN/DE, then separate instructions
     if subject is None:
-        body = (
-            f"{content}\n\n"
-            "Use this code to log in. Valid for 15 minutes.\n"
-            "Verwenden Sie diesen Code zum Anmelden. Gültig für 15 Minuten.\n\n"
-            "If you did not request this, you can ignore this email.\n"
-            "Falls Sie dies nicht angefordert haben, können Sie diese E-Mail ignorieren.\n"
-        )
+        # Verification email: code line + precompiled static suffix
+        body = content + _VERIFY_BODY_SUFFIX
     else:
         # For custom subjects (like bug reports), use content as-is
         body = content
@@ -1,6 +1,7 @@
 import asyncio
-from contextlib import suppress
+from contextlib import asynccontextmanager, suppress
 import logging
+from collections.abc import AsyncGenerator
 
 from fastapi import Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
@@ -15,7 +16,6 @@ from .routers import admin, analytics, auth, dashboard, feedback, finalized_week
 settings = get_settings()
 logger = logging.getLogger(__name__)
 FEEDBACK_REPORT_CLEANUP_INTERVAL_SECONDS = 24 * 60 * 60
-_feedback_report_cleanup_task: asyncio.Task[None] | None = None
 
 
 def _run_feedback_report_cleanup() -> None:
@@ -32,12 +32,30 @@ async def _feedback_report_cleanup_loop() -> None:
         await asyncio.sleep(FEEDBACK_REPORT_CLEANUP_INTERVAL_SECONDS)
         _run_feedback_report_cleanup()
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Startup/shutdown via the lifespan API (on_event is deprecated).
+
+    init_db() also pre-opens a pool connection, so the first request
+    does not pay connection setup.
+    """
+    init_db()
+    _ensure_demo_user_flagged()
+    _run_feedback_report_cleanup()
+    cleanup_task = asyncio.create_task(_feedback_report_cleanup_loop())
+    yield
+    cleanup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await cleanup_task
+
+
 app = FastAPI(
     title="Open Working Hours API",
     version="0.1.0",
     docs_url="/docs" if settings.docs_enabled else None,
     redoc_url="/redoc" if settings.docs_enabled else None,
     openapi_url="/openapi.json" if settings.docs_enabled else None,
+    lifespan=_lifespan,
 )
 
 
@@ -67,27 +85,6 @@ def _ensure_demo_user_flagged() -> None:
         logger.exception("Failed to ensure demo user flag")
 
 
-@app.on_event("startup")
-async def on_startup() -> None:
-    global _feedback_report_cleanup_task
-    init_db()
-    _ensure_demo_user_flagged()
-    _run_feedback_report_cleanup()
-    _feedback_report_cleanup_task = asyncio.create_task(_feedback_report_cleanup_loop())
-
-
-@app.on_event("shutdown")
-async def on_shutdown() -> None:
-    global _feedback_report_cleanup_task
-    if _feedback_report_cleanup_task is None:
-        return
-
-    _feedback_report_cleanup_task.cancel()
-    with suppress(asyncio.CancelledError):
-        await _feedback_report_cleanup_task
-    _feedback_report_cleanup_task = None
-
-
 @app.get("/healthz", tags=["meta"])
 def healthcheck(response: Response, _rl: None = Depends(rate_limit(30, 60))) -> dict[str, str]:
     """Liveness + DB connectivity: a dead database must not report healthy."""
@@ -101,27 +98,33 @@ def healthcheck(response: Response, _rl: None = Depends(rate_limit(30, 60))) ->
     return {"status": "ok"}
 
 
-app.include_router(admin.router)
-app.include_router(verification.router)
-app.include_router(auth.router)
-app.include_router(work_events.router)
-app.include_router(finalized_weeks.router)
-app.include_router(stats.router)
-app.include_router(dashboard.router)
-app.include_router(reports.router)
-app.include_router(analytics.router)
-app.include_router(submissions.router)
-app.include_router(feedback.router)
-app.include_router(taxonomy.router)
-
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type"],
     allow_credentials=True,
+    # Let browsers cache preflight results for a day instead of paying an
+    # OPTIONS round-trip per endpoint per page load.
+    max_age=86400,
 )
 
+for _router_module in (
+    admin,
+    verification,
+    auth,
+    work_events,
+    finalized_weeks,
+    stats,
+    dashboard,
+    reports,
+    analytics,
+    submissions,
+    feedback,
+    taxonomy,
+):
+    app.include_router(_router_module.router)
+
 
 @app.middleware("http")
 async def security_headers_middleware(request: Request, call_next) -> Response:
@@ -4,8 +4,8 @@ from datetime import datetime
 from enum import Enum
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Integer, Numeric, String, Text, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, Integer, Numeric, String, Text, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import UUID, JSON, JSONB
 from sqlalchemy.orm import declarative_base, relationship
 
 from .dp_group_stats.policy import PublicationStatus
@@ -23,14 +23,16 @@ class VerificationRequest(Base):
     __tablename__ = "verification_requests"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    email_hash = Column(String(128), index=True, nullable=False)
+    # No separate index: the unique constraint below already serves every
+    # email_hash lookup (the table is one row per email).
+    email_hash = Column(String(128), nullable=False)
     email_domain = Column(String(255), index=True, nullable=False)
-    code_hash = Column(String(128), nullable=False)
+    code_hash = Column(String(128), index=True, nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=False)
     confirmed_at = Column(DateTime(timezone=True))
     status = Column(String(32), nullable=False, default=VerificationStatus.pending.value)
     attempt_count = Column(Integer, default=0, nullable=False)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False)
 
     __table_args__ = (
         UniqueConstraint("email_hash", name="uq_verification_email_hash"),
@@ -53,7 +55,12 @@ class Report(Base):
     actual_hours_worked = Column(Numeric(precision=5, scale=2), nullable=False)
     overtime_hours = Column(Numeric(precision=5, scale=2), nullable=False, default=0)
     notes = Column(Text)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Serves the monthly analytics rollup (hospital x month x group).
+        Index("ix_reports_hospital_month_group", "hospital_domain", "shift_date", "staff_group"),
+    )
 
 
 class WeeklySubmission(Base):
@@ -65,7 +72,7 @@ class WeeklySubmission(Base):
     planned_hours = Column(Numeric(precision=6, scale=2), nullable=False)
     actual_hours = Column(Numeric(precision=6, scale=2), nullable=False)
     client_version = Column(String(64), nullable=False)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False)
 
 
 # ============================================================================
@@ -87,8 +94,8 @@ class User(Base):
     role_level = Column(String(50), nullable=False)
     state_code = Column(String(10), index=True)
     country_code = Column(String(3), nullable=False, default='DEU')
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), onupdate=datetime.utcnow, nullable=False)
     last_submission_at = Column(DateTime(timezone=True))
 
     # Social auth (NULL for email users)
@@ -111,9 +118,10 @@ class User(Base):
     # so publicly-known credentials cannot poison published statistics.
     is_demo = Column(Boolean, nullable=False, default=False, server_default="false")
 
-    # Relationships
-    work_events = relationship("WorkEvent", back_populates="user", cascade="all, delete-orphan")
-    finalized_weeks = relationship("FinalizedUserWeek", back_populates="user", cascade="all, delete-orphan")
+    # Relationships. passive_deletes: the FKs declare ON DELETE CASCADE, so
+    # deleting a user must not load every child row just to delete it again.
+    work_events = relationship("WorkEvent", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    finalized_weeks = relationship("FinalizedUserWeek", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
 
     __table_args__ = (
         UniqueConstraint("auth_provider", "provider_sub", name="uq_user_auth_provider_sub"),
@@ -138,13 +146,26 @@ class WorkEvent(Base):
     planned_hours = Column(Numeric(precision=5, scale=2), nullable=False)
     actual_hours = Column(Numeric(precision=5, scale=2), nullable=False)
     source = Column(String(20), nullable=False)  # 'geofence', 'manual', 'mixed'
-    submitted_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, index=True)
+    submitted_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False, index=True)
 
     # Relationship
     user = relationship("User", back_populates="work_events")
 
     __table_args__ = (
         UniqueConstraint("user_id", "date", name="uq_work_event_user_date"),
+        # Covers date-windowed distinct-user counts from the index alone.
+        Index("ix_work_events_date_user", "date", "user_id"),
+        # Covering index for the submitted_at-ordered/windowed queries: the
+        # admin dashboard's recent-events top-10 and the public dashboard's
+        # 30-day COUNT(*) / COUNT(DISTINCT user_id). With the selected
+        # columns INCLUDEd, Postgres answers all of them with an index-only
+        # scan and no heap fetches — query cost tracks the window, not the
+        # table. INCLUDE is a Postgres-only kwarg, ignored on SQLite.
+        Index(
+            "ix_work_events_recent_cover",
+            submitted_at.desc(),
+            postgresql_include=["date", "planned_hours", "actual_hours", "source", "user_id"],
+        ),
     )
 
 
@@ -181,7 +202,7 @@ class FinalizedUserWeek(Base):
     specialization_code = Column(String(10), nullable=True)
     hospital_ref_id = Column(Integer, nullable=True)
 
-    finalized_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, index=True)
+    finalized_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False, index=True)
 
     user = relationship("User", back_populates="finalized_weeks")
 
@@ -203,7 +224,7 @@ class StateSpecialtyReleaseCell(Base):
     state_code = Column(String(10), nullable=False, index=True)
     specialty = Column(String(100), nullable=False, index=True)
     is_enabled = Column(Boolean, nullable=False, default=True)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False)
 
     __table_args__ = (
         UniqueConstraint(
@@ -232,7 +253,7 @@ class StateSpecialtyPrivacyLedger(Base):
     planned_sum_epsilon = Column(Numeric(precision=6, scale=3), nullable=False)
     actual_sum_epsilon = Column(Numeric(precision=6, scale=3), nullable=False)
     total_epsilon = Column(Numeric(precision=6, scale=3), nullable=False)
-    recorded_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    recorded_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False)
 
     __table_args__ = (
         UniqueConstraint(
@@ -261,7 +282,7 @@ class UserPrivacyLedger(Base):
     family_key = Column(String(50), nullable=False, default="state_specialty_v1")
     cell_key = Column(String(255), nullable=False)
     epsilon_spent = Column(Numeric(precision=6, scale=3), nullable=False)
-    recorded_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    recorded_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False)
 
     __table_args__ = (
         UniqueConstraint(
@@ -302,7 +323,7 @@ class StatsByStateSpecialty(Base):
 
     k_min_threshold = Column(Integer, nullable=False)
     noise_epsilon = Column(Numeric(precision=4, scale=2), nullable=False)
-    computed_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    computed_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False)
 
     __table_args__ = (
         UniqueConstraint(
@@ -333,7 +354,7 @@ class StatsByHospital(Base):
 
     k_min_threshold = Column(Integer, nullable=False)
     noise_epsilon = Column(Numeric(precision=4, scale=2), nullable=False)
-    computed_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    computed_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False)
 
     __table_args__ = (
         UniqueConstraint(
@@ -362,13 +383,26 @@ class FeedbackReport(Base):
     # User's description
     description = Column(Text, nullable=True)
 
-    # App state (JSON)
-    app_state = Column(JSON, nullable=False)
+    # App state. JSONB on Postgres (stored pre-parsed, no reparse on admin
+    # reads, GIN-indexable later); plain JSON on SQLite for the test harness.
+    app_state = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
 
     # Metadata
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False, index=True)
     resolved = Column(String(20), default="pending", nullable=False)  # pending, resolved, dismissed
 
+    __table_args__ = (
+        # Partial index for the default admin view (pending, newest first)
+        Index(
+            "ix_feedback_reports_pending_recent",
+            created_at.desc(),
+            postgresql_where=(resolved == "pending"),
+            sqlite_where=(resolved == "pending"),
+        ),
+        # Covers listings filtered on the other status values
+        Index("ix_feedback_reports_resolved_recent", "resolved", created_at.desc()),
+    )
+
 
 class InstitutionInquiry(Base):
     """
@@ -387,7 +421,34 @@ class InstitutionInquiry(Base):
     message = Column(Text, nullable=False)
 
     # Status tracking
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, server_default=func.now(), nullable=False, index=True)
     responded_at = Column(DateTime(timezone=True), nullable=True)
     status = Column(String(20), default="pending", nullable=False)  # pending, responded, archived
     notes = Column(Text, nullable=True)  # Internal notes for follow-up
+
+
+def bulk_insert_work_events(db, events: list[dict]) -> int:
+    """Insert many work events in one statement.
+
+    A single multi-row INSERT ... ON CONFLICT (user_id, date) DO NOTHING
+    replaces per-row session.add() round-trips for batch submissions.
+    Rows are dicts keyed by WorkEvent column names; event_id/submitted_at
+    fall back to the column defaults when omitted. Ids stay client-side
+    (uuid4 column default): a gen_random_uuid() server default would be
+    Postgres-only DDL that the SQLite test harness cannot evaluate, for
+    a per-row saving that is noise at our batch sizes. Returns the number
+    of rows actually inserted (already-submitted days are skipped).
+    """
+    if not events:
+        return 0
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    stmt = (
+        dialect_insert(WorkEvent)
+        .values(events)
+        .on_conflict_do_nothing(index_elements=["user_id", "date"])
+    )
+    result = db.execute(stmt)
+    return result.rowcount
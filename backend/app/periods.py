@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import calendar
 from datetime import date, timedelta
+from functools import lru_cache
 
 from .dp_group_stats.config import PeriodType
 
 
+@lru_cache(maxsize=4096)
 def get_iso_week_bounds(target_date: date) -> tuple[date, date]:
     iso_year, iso_week, _ = target_date.isocalendar()
     week_start = date.fromisocalendar(iso_year, iso_week, 1)
@@ -4,14 +4,22 @@ Provides monitoring data for the admin web dashboard.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import hmac
+import html
+import json
+import re
 import secrets
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from sqlalchemy import func
+from sqlalchemy import Text, cast, func, select, text
 from sqlalchemy.orm import Session
 
 from ..database import get_db
@@ -45,13 +53,27 @@ if not ADMIN_PASSWORD:
         "Add it to .env.production: ADMIN_PASSWORD=your-secure-password"
     )
 
+# Compare an HMAC digest of the credentials instead of the raw strings so the
+# plaintext password does not stay resident in process memory after startup
+# (heap dumps, tracebacks). Username and password are NUL-joined into one
+# digest: a single fixed-length compare, no length leak, no short-circuit.
+# (NUL cannot appear inside basic-auth fields, so the join is unambiguous.)
+_ADMIN_AUTH_KEY = b"admin-basic-auth"
+_ADMIN_CREDENTIALS_DIGEST = hmac.digest(
+    _ADMIN_AUTH_KEY, f"{ADMIN_USERNAME}\x00{ADMIN_PASSWORD}".encode("utf-8"), "sha256"
+)
+del ADMIN_PASSWORD
+
 
 def verify_admin(credentials: Annotated[HTTPBasicCredentials, Depends(security)]) -> str:
     """Verify admin credentials using basic auth"""
-    correct_username = secrets.compare_digest(credentials.username, ADMIN_USERNAME)
-    correct_password = secrets.compare_digest(credentials.password, ADMIN_PASSWORD)
+    candidate_digest = hmac.digest(
+        _ADMIN_AUTH_KEY,
+        f"{credentials.username}\x00{credentials.password}".encode("utf-8"),
+        "sha256",
+    )
 
-    if not (correct_username and correct_password):
+    if not secrets.compare_digest(candidate_digest, _ADMIN_CREDENTIALS_DIGEST):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
@@ -60,10 +82,10 @@ def verify_admin(credentials: Annotated[HTTPBasicCredentials, Depends(security)]
     return credentials.username
 
 
-@router.get("/", response_class=HTMLResponse)
-def get_dashboard_page(username: str = Depends(verify_admin), _rl: None = Depends(rate_limit(10, 60))) -> str:
-    """Serve the admin dashboard HTML page"""
-    return """
+# Static dashboard shell, encoded to bytes once at import so each request
+# skips the str->bytes re-encode. The page polls /admin/data every 30s;
+# after the first load the shell itself is just a 304.
+_DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -288,6 +310,22 @@ def get_dashboard_page(username: str = Depends(verify_admin), _rl: None = Depend
             color: #616161;
         }
 
+        .load-more-button {
+            display: block;
+            width: 100%;
+            padding: 10px;
+            background: white;
+            color: #1B7A5E;
+            border: 1px solid #1B7A5E;
+            border-radius: 8px;
+            cursor: pointer;
+            font-size: 14px;
+        }
+
+        .load-more-button:hover {
+            background: #e8f5e9;
+        }
+
         .report-user {
             font-size: 14px;
             color: #333;
@@ -494,6 +532,8 @@ def get_dashboard_page(username: str = Depends(verify_admin), _rl: None = Depend
                 <div id="reports-list">
                     <div class="loading">Loading reports...</div>
                 </div>
+                <button id="reports-load-more" class="load-more-button" style="display: none;"
+                        onclick="fetchReports(true)">Load older reports</button>
             </div>
         </div>
     </div>
@@ -504,40 +544,27 @@ def get_dashboard_page(username: str = Depends(verify_admin), _rl: None = Depend
             return String(str).replace(/&/g,'&amp;').replace(/</g,'&lt;').replace(/>/g,'&gt;').replace(/"/g,'&quot;');
         }
 
-        async function fetchDashboardData() {
-            try {
-                const response = await fetch('/admin/data');
-                if (!response.ok) throw new Error('Failed to fetch data');
-
-                const data = await response.json();
-
-                // Update stats
+        function renderDashboardData(data) {
+            // Update stats
                 document.getElementById('total-users').textContent = data.total_users;
                 document.getElementById('total-events').textContent = data.total_work_events;
                 document.getElementById('events-24h').textContent = data.events_last_24h;
                 document.getElementById('total-stats').textContent = data.total_stats;
 
-                // Update recent events
-                const eventsList = document.getElementById('recent-events');
-                if (data.recent_events.length === 0) {
-                    eventsList.innerHTML = '<li class="event-item">No events yet</li>';
-                } else {
-                    eventsList.innerHTML = data.recent_events.map(event => `
-                        <li class="event-item">
-                            <div>
-                                <div class="event-date">${event.date}</div>
-                                <div class="event-hours">
-                                    Planned: ${event.planned_hours}h | Actual: ${event.actual_hours}h
-                                </div>
-                            </div>
-                            <span class="badge badge-${event.source}">${event.source}</span>
-                        </li>
-                    `).join('');
-                }
+                // Update recent events (rendered and escaped server-side)
+                document.getElementById('recent-events').innerHTML = data.recent_events_html;
 
                 // Update timestamp
                 document.getElementById('last-updated').textContent =
                     `Last updated: ${new Date().toLocaleTimeString()}`;
+        }
+
+        async function fetchDashboardData() {
+            try {
+                const response = await fetch('/admin/data');
+                if (!response.ok) throw new Error('Failed to fetch data');
+
+                renderDashboardData(await response.json());
 
                 // Hide error if showing
                 document.getElementById('error-message').style.display = 'none';
@@ -550,8 +577,14 @@ def get_dashboard_page(username: str = Depends(verify_admin), _rl: None = Depend
             }
         }
 
-        // Initial load
-        fetchDashboardData();
+        // First paint renders the payload inlined by the server, saving the
+        // initial /admin/data round-trip; refreshes go through fetch.
+        window.__BOOT__ = __BOOT_PAYLOAD__;
+        if (window.__BOOT__) {
+            renderDashboardData(window.__BOOT__);
+        } else {
+            fetchDashboardData();
+        }
 
         // Refresh every 30 seconds
         setInterval(fetchDashboardData, 30000);
@@ -580,21 +613,30 @@ def get_dashboard_page(username: str = Depends(verify_admin), _rl: None = Depend
             }
         }
 
-        // Fetch and display bug reports
-        async function fetchReports() {
+        // Fetch and display bug reports (keyset-paginated on created_at)
+        let reportsNextCursor = null;
+
+        async function fetchReports(loadMore = false) {
             try {
-                const response = await fetch('/admin/reports');
+                let url = '/admin/reports?limit=50';
+                if (loadMore && reportsNextCursor) {
+                    url += '&before=' + encodeURIComponent(reportsNextCursor);
+                }
+                const response = await fetch(url);
                 if (!response.ok) throw new Error('Failed to fetch reports');
 
                 const data = await response.json();
+                reportsNextCursor = data.next_cursor;
                 const reportsList = document.getElementById('reports-list');
+                const loadMoreButton = document.getElementById('reports-load-more');
 
-                if (data.reports.length === 0) {
+                if (!loadMore && data.reports.length === 0) {
                     reportsList.innerHTML = '<div class="loading">No reports yet</div>';
+                    loadMoreButton.style.display = 'none';
                     return;
                 }
 
-                reportsList.innerHTML = data.reports.map(report => {
+                const reportsHtml = data.reports.map(report => {
                     const timestamp = new Date(report.created_at).toLocaleString();
                     const userInfo = report.user_id ? escapeHtml(report.user_id).slice(0, 8) : 'Anonymous';
                     const statusClass = escapeHtml(report.resolved);
@@ -643,6 +685,13 @@ def get_dashboard_page(username: str = Depends(verify_admin), _rl: None = Depend
                         </div>
                     `;
                 }).join('');
+
+                if (loadMore) {
+                    reportsList.insertAdjacentHTML('beforeend', reportsHtml);
+                } else {
+                    reportsList.innerHTML = reportsHtml;
+                }
+                loadMoreButton.style.display = reportsNextCursor ? 'block' : 'none';
             } catch (error) {
                 console.error('Error fetching reports:', error);
                 document.getElementById('reports-list').innerHTML =
@@ -731,36 +780,144 @@ def get_dashboard_page(username: str = Depends(verify_admin), _rl: None = Depend
     </script>
 </body>
 </html>
-    """
+"""
 
+# Shell pre-split around the bootstrap placeholder so the per-request work
+# is one json.dumps plus a bytes join.
+_DASHBOARD_HTML_PRE, _DASHBOARD_HTML_POST = _DASHBOARD_HTML.encode("utf-8").split(
+    b"__BOOT_PAYLOAD__"
+)
 
-@router.get("/data")
-def get_dashboard_data(
+
+@router.get("/", response_class=HTMLResponse)
+def get_dashboard_page(
+    request: Request,
     username: str = Depends(verify_admin),
     db: Session = Depends(get_db),
-    _rl: None = Depends(rate_limit(30, 60)),
-) -> dict:
-    """Get dashboard data (JSON) for the admin interface"""
+    _rl: None = Depends(rate_limit(10, 60)),
+) -> Response:
+    """Serve the admin dashboard HTML page with the first payload inlined.
+
+    Embedding the initial dashboard JSON saves the serial /admin/ ->
+    /admin/data round-trip chain on every page load; only the 30s
+    refreshes hit /admin/data.
 
-    # Total counts
-    total_users = db.query(func.count(User.user_id)).scalar() or 0
-    total_work_events = db.query(func.count(WorkEvent.event_id)).scalar() or 0
-    total_stats = db.query(func.count(StatsByStateSpecialty.stat_id)).scalar() or 0
+    The body is stable for a whole payload-cache window, so an ETag
+    computed over it lets reloads within the window answer 304 with
+    zero bytes. Cache-Control stays private (the page is auth-gated).
+    """
+    payload = _collect_dashboard(db)
+    body = b"".join(
+        (_DASHBOARD_HTML_PRE, json.dumps(payload).encode("utf-8"), _DASHBOARD_HTML_POST)
+    )
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="text/html; charset=utf-8", headers=headers)
 
-    # Last 24 hours activity
-    yesterday = datetime.now(timezone.utc) - timedelta(hours=24)
-    events_last_24h = db.query(func.count(WorkEvent.event_id)).filter(
-        WorkEvent.submitted_at >= yesterday
-    ).scalar() or 0
+
+# Tables whose dashboard totals may be served from planner estimates.
+_APPROX_COUNT_TABLES = ("users", "work_events", "stats_by_state_specialty")
+
+
+def _approx_total_counts(db: Session) -> dict[str, int] | None:
+    """Planner estimates for the unbounded table totals, or None.
+
+    Exact COUNT(*) scans the whole table/index and grows O(N); the admin
+    dashboard refreshes every 30s and tolerates stale totals, so on
+    Postgres we read pg_class.reltuples instead (O(1) regardless of table
+    size). Returns None on other dialects or when a table has never been
+    analyzed (reltuples = -1 on PG 13+), in which case the caller falls
+    back to exact counts.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    table_list = ", ".join(f"'{table}'" for table in _APPROX_COUNT_TABLES)
+    rows = db.execute(
+        text(
+            "SELECT relname, reltuples::bigint FROM pg_class "
+            f"WHERE relname IN ({table_list})"
+        )
+    ).all()
+    estimates = {name: count for name, count in rows}
+    if any(estimates.get(table, -1) < 0 for table in _APPROX_COUNT_TABLES):
+        return None
+    return estimates
+
+
+# Payload cache: the dashboard polls every 30s and every open tab repeats
+# the same counts + top-10 query. A 15s TTL collapses concurrent tabs to
+# one DB hit per window while staying fresher than the poll interval.
+_DASHBOARD_CACHE_TTL_SECONDS = 15.0
+_dashboard_cache_lock = threading.Lock()
+_dashboard_cache: tuple[float, dict] | None = None
+
+
+def _collect_dashboard(db: Session) -> dict:
+    """Cached dashboard payload (shared by /admin/ bootstrap and /admin/data)."""
+    global _dashboard_cache
+    with _dashboard_cache_lock:
+        if (
+            _dashboard_cache is not None
+            and time.monotonic() - _dashboard_cache[0] < _DASHBOARD_CACHE_TTL_SECONDS
+        ):
+            return _dashboard_cache[1]
+
+    payload = _compute_dashboard(db)
+    with _dashboard_cache_lock:
+        _dashboard_cache = (time.monotonic(), payload)
+    return payload
+
+
+def _compute_dashboard(db: Session) -> dict:
+    # Quantize the 24h window to 5-minute buckets: a constantly-moving
+    # boundary makes every poll a distinct bind value, defeating DB-side
+    # plan/result caching for a number that is approximate anyway.
+    now = datetime.now(timezone.utc)
+    bucket = now.replace(minute=(now.minute // 5) * 5, second=0, microsecond=0)
+    yesterday = bucket - timedelta(hours=24)
+    approx = _approx_total_counts(db)
+    if approx is not None:
+        total_users = approx["users"]
+        total_work_events = approx["work_events"]
+        total_stats = approx["stats_by_state_specialty"]
+        # The 24h window is bounded by the submitted_at index — keep it exact.
+        events_last_24h = (
+            db.execute(
+                select(func.count(WorkEvent.event_id)).where(
+                    WorkEvent.submitted_at >= yesterday
+                )
+            ).scalar()
+            or 0
+        )
+    else:
+        # All four counts in one round-trip (scalar subqueries) — the endpoint
+        # is RTT-bound against remote Postgres, not CPU-bound.
+        counts_stmt = select(
+            select(func.count(User.user_id)).scalar_subquery(),
+            select(func.count(WorkEvent.event_id)).scalar_subquery(),
+            select(func.count(StatsByStateSpecialty.stat_id)).scalar_subquery(),
+            select(func.count(WorkEvent.event_id))
+            .where(WorkEvent.submitted_at >= yesterday)
+            .scalar_subquery(),
+        )
+        total_users, total_work_events, total_stats, events_last_24h = db.execute(
+            counts_stmt
+        ).one()
 
     # Recent work events (last 10)
-    recent_events = db.query(
-        WorkEvent.date,
-        WorkEvent.planned_hours,
-        WorkEvent.actual_hours,
-        WorkEvent.source,
-        WorkEvent.submitted_at
-    ).order_by(WorkEvent.submitted_at.desc()).limit(10).all()
+    recent_events = db.execute(
+        select(
+            WorkEvent.date,
+            WorkEvent.planned_hours,
+            WorkEvent.actual_hours,
+            WorkEvent.source,
+            WorkEvent.submitted_at,
+        )
+        .order_by(WorkEvent.submitted_at.desc())
+        .limit(10)
+    ).all()
 
     recent_events_data = [
         {
@@ -779,59 +936,135 @@ def get_dashboard_data(
         "total_stats": total_stats,
         "events_last_24h": events_last_24h,
         "recent_events": recent_events_data,
+        "recent_events_html": _render_recent_events_html(recent_events_data),
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 
+def _render_recent_events_html(events: list[dict]) -> str:
+    """Render the recent-events <li> block server-side.
+
+    Rendered once per cache window instead of re-templated in JS on
+    every 30 s poll in every open tab. Escaped here since the browser
+    injects it via innerHTML.
+    """
+    if not events:
+        return '<li class="event-item">No events yet</li>'
+    return "".join(
+        '<li class="event-item">'
+        "<div>"
+        f'<div class="event-date">{event["date"]}</div>'
+        '<div class="event-hours">'
+        f'Planned: {event["planned_hours"]:g}h | Actual: {event["actual_hours"]:g}h'
+        "</div>"
+        "</div>"
+        f'<span class="badge badge-{html.escape(event["source"])}">{html.escape(event["source"])}</span>'
+        "</li>"
+        for event in events
+    )
+
+
+@router.get("/data")
+def get_dashboard_data(
+    username: str = Depends(verify_admin),
+    db: Session = Depends(get_db),
+    _rl: None = Depends(rate_limit(30, 60)),
+) -> dict:
+    """Get dashboard data (JSON) for the admin interface"""
+    return _collect_dashboard(db)
+
+
 @router.get("/reports")
 def get_feedback_reports(
     status: str | None = None,
     limit: int = 100,
+    before: datetime | None = None,
     username: str = Depends(verify_admin),
     db: Session = Depends(get_db),
     _rl: None = Depends(rate_limit(10, 60)),
-) -> dict:
+) -> Response:
     """Get bug reports and feedback from mobile app users
 
+    `app_state` is fetched as its raw stored JSON text (CAST to TEXT in
+    SQL) and spliced verbatim into the response body, so the
+    potentially-largest field is never parsed into Python dicts just to
+    be re-serialized.
+
     Args:
         status: Filter by resolution status (pending, resolved, dismissed)
         limit: Number of reports to return (default: 100, max: 500)
+        before: Keyset cursor — only return reports created before this
+            timestamp. `next_cursor` in the response feeds the next page.
     """
     # Limit to prevent abuse
     limit = min(limit, 500)
 
-    # Build query
-    query = db.query(FeedbackReport)
+    # Build query (2.x select() so the compiled-SQL cache applies across polls)
+    stmt = select(
+        FeedbackReport.report_id,
+        FeedbackReport.created_at,
+        FeedbackReport.user_id,
+        FeedbackReport.hospital_id,
+        FeedbackReport.specialty,
+        FeedbackReport.role_level,
+        FeedbackReport.state_code,
+        FeedbackReport.description,
+        cast(FeedbackReport.app_state, Text).label("app_state_json"),
+        FeedbackReport.resolved,
+    )
 
     # Filter by status if provided
     if status:
-        query = query.filter(FeedbackReport.resolved == status)
+        stmt = stmt.where(FeedbackReport.resolved == status)
+
+    # Keyset pagination: strictly-older rows, so the created_at index
+    # short-circuits instead of scanning past an OFFSET
+    if before is not None:
+        stmt = stmt.where(FeedbackReport.created_at < before)
 
     # Order by most recent first
-    reports = query.order_by(FeedbackReport.created_at.desc()).limit(limit).all()
+    rows = db.execute(
+        stmt.order_by(FeedbackReport.created_at.desc()).limit(limit)
+    ).all()
 
     # Format response
-    reports_data = [
-        {
-            "report_id": str(report.report_id),
-            "created_at": report.created_at.isoformat(),
-            "user_id": report.user_id,
-            "hospital_id": report.hospital_id,
-            "specialty": report.specialty,
-            "role_level": report.role_level,
-            "state_code": report.state_code,
-            "description": report.description,
-            "app_state": report.app_state,
-            "resolved": report.resolved,
-        }
-        for report in reports
-    ]
+    report_fragments = []
+    for row in rows:
+        fields = json.dumps(
+            {
+                "report_id": str(row.report_id),
+                "created_at": row.created_at.isoformat(),
+                "user_id": row.user_id,
+                "hospital_id": row.hospital_id,
+                "specialty": row.specialty,
+                "role_level": row.role_level,
+                "state_code": row.state_code,
+                "description": row.description,
+                "resolved": row.resolved,
+            }
+        )
+        # Splice the raw stored JSON in before the closing brace
+        report_fragments.append(
+            fields[:-1] + ', "app_state": ' + row.app_state_json + "}"
+        )
 
-    return {
-        "total": len(reports_data),
-        "reports": reports_data,
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }
+    # Full page ⇒ there may be older rows; short page ⇒ end of list
+    next_cursor = rows[-1].created_at.isoformat() if len(rows) == limit else None
+
+    body = "".join(
+        (
+            '{"total": ',
+            str(len(report_fragments)),
+            ', "reports": [',
+            ", ".join(report_fragments),
+            '], "next_cursor": ',
+            json.dumps(next_cursor),
+            ', "timestamp": ',
+            json.dumps(datetime.now(timezone.utc).isoformat()),
+            "}",
+        )
+    )
+    return Response(content=body.encode("utf-8"), media_type="application/json")
 
 
 @router.get("/release-cells/state-specialty", response_model=list[StateSpecialtyReleaseCellOut])
@@ -900,16 +1133,76 @@ def upsert_state_specialty_release_cells(
     )
 
 
+_LOG_STREAM_CHUNK_BYTES = 16 * 1024
+
+
+def _compile_log_filter(search: str | None, level: str | None) -> re.Pattern[bytes] | None:
+    """Combine the search and level filters into one compiled bytes regex.
+
+    Each term becomes a lookahead, so a line must contain every given
+    term (anywhere, case-insensitively) to pass. Returns None when no
+    filters are set.
+    """
+    terms = [term for term in (search, level) if term]
+    if not terms:
+        return None
+    pattern = b"".join(
+        b"(?=.*" + re.escape(term.encode("utf-8")) + b")" for term in terms
+    )
+    return re.compile(pattern, re.IGNORECASE)
+
+
+async def _stream_log_lines(
+    proc: asyncio.subprocess.Process,
+    search: str | None,
+    level: str | None,
+) -> AsyncIterator[bytes]:
+    """Yield filtered log lines as the subprocess produces them.
+
+    Lines are batched into ~16 KB chunks before yielding: every chunk
+    costs an ASGI send() round-trip, so per-line yields would dominate
+    the cost of tailing large logs.
+
+    Both filters are folded into one case-insensitive regex compiled
+    once per request — lookaheads give AND semantics when both are set,
+    and no per-line lower()/upper() copies are allocated.
+    """
+    line_filter = _compile_log_filter(search, level)
+    assert proc.stdout is not None
+    buf = bytearray()
+    try:
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                break
+            if line_filter is not None and line_filter.match(line) is None:
+                continue
+            buf += line
+            if len(buf) >= _LOG_STREAM_CHUNK_BYTES:
+                yield bytes(buf)
+                buf.clear()
+        if buf:
+            yield bytes(buf)
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+        await proc.wait()
+
+
 @router.get("/logs")
-def get_logs(
+async def get_logs(
     source: str = "backend",
     lines: int = 100,
     search: str | None = None,
     level: str | None = None,
     username: str = Depends(verify_admin),
     _rl: None = Depends(rate_limit(10, 60)),
-) -> dict:
-    """Get logs from Docker containers with filtering
+) -> StreamingResponse:
+    """Stream logs from Docker containers with filtering.
+
+    Lines are filtered and forwarded as they arrive instead of buffering
+    the whole log output in memory, so memory use is constant regardless
+    of `lines` and the first bytes reach the client immediately.
 
     Args:
         source: Log source (backend, aggregation, nginx)
@@ -917,65 +1210,31 @@ def get_logs(
         search: Search term to filter logs
         level: Filter by log level (ERROR, WARNING, INFO)
     """
-    import subprocess
-
     # Limit lines to prevent abuse
     lines = min(lines, 1000)
 
-    try:
-        # Get logs based on source
-        if source == "backend":
-            result = subprocess.run(
-                ["docker", "compose", "logs", "--tail", str(lines), "backend"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-        elif source == "aggregation":
-            # Get aggregation logs from log files
-            import glob as glob_module
-            log_files = sorted(glob_module.glob("/home/deploy/logs/aggregation*.log"))
-            if not log_files:
-                return {
-                    "source": source,
-                    "lines_requested": lines,
-                    "logs": "",
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
-            result = subprocess.run(
-                ["tail", "-n", str(lines)] + log_files,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-        elif source == "nginx":
-            result = subprocess.run(
-                ["docker", "compose", "logs", "--tail", str(lines), "nginx"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-        else:
-            raise HTTPException(status_code=400, detail="Invalid log source")
-
-        logs = result.stdout
-
-        # Apply search filter
-        if search:
-            logs = "\n".join([line for line in logs.split("\n") if search.lower() in line.lower()])
+    if source in ("backend", "nginx"):
+        cmd = ["docker", "compose", "logs", "--tail", str(lines), source]
+    elif source == "aggregation":
+        # Get aggregation logs from log files
+        import glob as glob_module
+        log_files = sorted(glob_module.glob("/home/deploy/logs/aggregation*.log"))
+        if not log_files:
+            return StreamingResponse(iter(()), media_type="text/plain; charset=utf-8")
+        cmd = ["tail", "-n", str(lines)] + log_files
+    else:
+        raise HTTPException(status_code=400, detail="Invalid log source")
 
-        # Apply level filter
-        if level:
-            logs = "\n".join([line for line in logs.split("\n") if level.upper() in line.upper()])
-
-        return {
-            "source": source,
-            "lines_requested": lines,
-            "logs": logs,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        }
-
-    except subprocess.TimeoutExpired:
-        raise HTTPException(status_code=504, detail="Log fetch timeout")
-    except Exception as e:
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch logs: {str(e)}")
+
+    return StreamingResponse(
+        _stream_log_lines(proc, search, level),
+        media_type="text/plain; charset=utf-8",
+    )
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import math
 import random
+import threading
+import time
 from datetime import date
 from collections.abc import Generator
+from functools import lru_cache
 
 from fastapi import APIRouter, Depends, Query, Response
-from sqlalchemy import func, select
+from sqlalchemy import Float, cast, func, select, tuple_
 from sqlalchemy.orm import Session
 
 from ..database import get_db
@@ -20,14 +23,22 @@ from ..schemas import (
 router = APIRouter(prefix="/analytics", tags=["analytics"], deprecated=True)
 
 SUPPRESSION_THRESHOLD = 5
-BOOTSTRAP_ITERATIONS = 200
 NOISE_SCALE = 0.05  # hours
+CI_Z = 1.96  # two-sided 95% normal quantile
 
 
 def _get_db_session() -> Generator[Session, None, None]:
     yield from get_db()
 
 
+# Overview cache: deprecated endpoint, likely polled; one entry per
+# (months, staff_group, day) parameter set.
+_OVERVIEW_CACHE_TTL_SECONDS = 3600.0
+_OVERVIEW_CACHE_MAX_ENTRIES = 64
+_overview_cache_lock = threading.Lock()
+_overview_cache: dict[tuple, tuple[float, AnalyticsResponse]] = {}
+
+
 @router.get("/", response_model=AnalyticsResponse, deprecated=True)
 def analytics_overview(
     months: int = Query(default=6, ge=1, le=36),
@@ -50,20 +61,43 @@ def analytics_overview(
         response.headers["Sunset"] = "2026-03-01"
         response.headers["Link"] = '</stats/by-state-specialty>; rel="alternate"'
 
-    hospital_rows = _fetch_hospital_monthly(db=db, months=months, staff_group=staff_group)
-    staff_group_rows = _fetch_staff_group_monthly(db=db, months=months, staff_group=staff_group)
-    return AnalyticsResponse(
+    # Result is deterministic per (params, day) apart from DP noise, and
+    # re-serving the SAME noised values is strictly better for privacy
+    # than drawing fresh noise per poll (no averaging-away the noise).
+    key = (months, staff_group.value if staff_group else None, date.today().toordinal())
+    with _overview_cache_lock:
+        hit = _overview_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < _OVERVIEW_CACHE_TTL_SECONDS:
+            return hit[1]
+
+    hospital_rows, staff_group_rows = _fetch_monthly_rollups(
+        db=db, months=months, staff_group=staff_group
+    )
+    result = AnalyticsResponse(
         hospital_monthly=hospital_rows,
         staff_group_monthly=staff_group_rows,
     )
+    with _overview_cache_lock:
+        if len(_overview_cache) >= _OVERVIEW_CACHE_MAX_ENTRIES:
+            _overview_cache.clear()
+        _overview_cache[key] = (time.monotonic(), result)
+    return result
 
 
-def _fetch_hospital_monthly(
+def _fetch_monthly_rollups(
     *,
     db: Session,
     months: int,
     staff_group: StaffGroup | None,
-) -> list[HospitalMonthlySummary]:
+) -> tuple[list[HospitalMonthlySummary], list[StaffGroupMonthlySummary]]:
+    """Both monthly rollups from one GROUPING SETS scan of Report.
+
+    The staff-group summary is the hospital summary aggregated over
+    hospital_domain, so one query with two grouping sets replaces two
+    full scans with identical predicates. hospital_domain is NOT NULL
+    in the table, so a NULL in a result row uniquely marks the
+    staff-group-level set.
+    """
     month_trunc = func.date_trunc("month", Report.shift_date).label("month_start")
     cutoff_date = _months_back_start(months)
 
@@ -73,104 +107,80 @@ def _fetch_hospital_monthly(
             Report.staff_group.label("staff_group"),
             month_trunc,
             func.count(Report.id).label("report_count"),
-            func.sum(Report.actual_hours_worked).label("total_actual_hours"),
-            func.sum(Report.overtime_hours).label("total_overtime_hours"),
-            func.array_agg(Report.actual_hours_worked).label("actual_samples"),
-            func.array_agg(Report.overtime_hours).label("overtime_samples"),
+            # Cast to float in SQL: Numeric would otherwise materialize a
+            # Decimal per aggregated row/sample only to be coerced right back.
+            cast(func.sum(Report.actual_hours_worked), Float).label("total_actual_hours"),
+            cast(func.sum(Report.overtime_hours), Float).label("total_overtime_hours"),
+            cast(func.avg(Report.actual_hours_worked), Float).label("avg_actual"),
+            cast(func.avg(Report.overtime_hours), Float).label("avg_overtime"),
+            cast(func.stddev_samp(Report.actual_hours_worked), Float).label("std_actual"),
+            cast(func.stddev_samp(Report.overtime_hours), Float).label("std_overtime"),
         )
         .where(Report.shift_date >= cutoff_date)
-        .group_by(Report.hospital_domain, Report.staff_group, month_trunc)
-        .order_by(month_trunc.desc(), Report.hospital_domain.asc(), Report.staff_group.asc())
-    )
-    if staff_group is not None:
-        query = query.where(Report.staff_group == staff_group.value)
-
-    results: list[HospitalMonthlySummary] = []
-    for row in db.execute(query):
-        month_start_dt = row.month_start.date() if hasattr(row.month_start, "date") else date.fromisoformat(row.month_start)
-        suppressed = row.report_count < SUPPRESSION_THRESHOLD
-        total_actual = float(row.total_actual_hours or 0)
-        total_overtime = float(row.total_overtime_hours or 0)
-        actual_samples = _to_float_list(row.actual_samples)
-        overtime_samples = _to_float_list(row.overtime_samples)
-        metrics = _compute_metrics(actual_samples, overtime_samples, row.report_count, suppressed)
-        results.append(
-            HospitalMonthlySummary(
-                hospital_domain=row.hospital_domain,
-                staff_group=StaffGroup(row.staff_group),
-                month_start=month_start_dt,
-                report_count=row.report_count,
-                average_actual_hours=None if suppressed else metrics["avg_actual"],
-                average_overtime_hours=None if suppressed else metrics["avg_overtime"],
-                total_actual_hours=None if suppressed else _safe_float(total_actual),
-                total_overtime_hours=None if suppressed else _safe_float(total_overtime),
-                ci_actual_low=None if suppressed else metrics["ci_actual_low"],
-                ci_actual_high=None if suppressed else metrics["ci_actual_high"],
-                ci_overtime_low=None if suppressed else metrics["ci_overtime_low"],
-                ci_overtime_high=None if suppressed else metrics["ci_overtime_high"],
-                suppressed=suppressed,
+        .group_by(
+            func.grouping_sets(
+                tuple_(Report.hospital_domain, Report.staff_group, month_trunc),
+                tuple_(Report.staff_group, month_trunc),
             )
         )
-    return results
-
-
-def _fetch_staff_group_monthly(
-    *,
-    db: Session,
-    months: int,
-    staff_group: StaffGroup | None,
-) -> list[StaffGroupMonthlySummary]:
-    month_trunc = func.date_trunc("month", Report.shift_date).label("month_start")
-    cutoff_date = _months_back_start(months)
-
-    query = (
-        select(
-            Report.staff_group.label("staff_group"),
-            month_trunc,
-            func.count(Report.id).label("report_count"),
-            func.sum(Report.actual_hours_worked).label("total_actual_hours"),
-            func.sum(Report.overtime_hours).label("total_overtime_hours"),
-            func.array_agg(Report.actual_hours_worked).label("actual_samples"),
-            func.array_agg(Report.overtime_hours).label("overtime_samples"),
-        )
-        .where(Report.shift_date >= cutoff_date)
-        .group_by(Report.staff_group, month_trunc)
-        .order_by(month_trunc.desc(), Report.staff_group.asc())
     )
     if staff_group is not None:
         query = query.where(Report.staff_group == staff_group.value)
 
-    results: list[StaffGroupMonthlySummary] = []
+    hospital_rows: list[HospitalMonthlySummary] = []
+    staff_group_rows: list[StaffGroupMonthlySummary] = []
     for row in db.execute(query):
         month_start_dt = row.month_start.date() if hasattr(row.month_start, "date") else date.fromisoformat(row.month_start)
         suppressed = row.report_count < SUPPRESSION_THRESHOLD
         total_actual = float(row.total_actual_hours or 0)
         total_overtime = float(row.total_overtime_hours or 0)
-        actual_samples = _to_float_list(row.actual_samples)
-        overtime_samples = _to_float_list(row.overtime_samples)
-        metrics = _compute_metrics(actual_samples, overtime_samples, row.report_count, suppressed)
-        results.append(
-            StaffGroupMonthlySummary(
-                staff_group=StaffGroup(row.staff_group),
-                month_start=month_start_dt,
-                report_count=row.report_count,
-                average_actual_hours=None if suppressed else metrics["avg_actual"],
-                average_overtime_hours=None if suppressed else metrics["avg_overtime"],
-                total_actual_hours=None if suppressed else _safe_float(total_actual),
-                total_overtime_hours=None if suppressed else _safe_float(total_overtime),
-                ci_actual_low=None if suppressed else metrics["ci_actual_low"],
-                ci_actual_high=None if suppressed else metrics["ci_actual_high"],
-                ci_overtime_low=None if suppressed else metrics["ci_overtime_low"],
-                ci_overtime_high=None if suppressed else metrics["ci_overtime_high"],
-                suppressed=suppressed,
-            )
+        metrics = _compute_metrics(
+            row.avg_actual,
+            row.std_actual,
+            row.avg_overtime,
+            row.std_overtime,
+            row.report_count,
+            suppressed,
         )
-    return results
+        common = dict(
+            staff_group=StaffGroup(row.staff_group),
+            month_start=month_start_dt,
+            report_count=row.report_count,
+            average_actual_hours=None if suppressed else metrics["avg_actual"],
+            average_overtime_hours=None if suppressed else metrics["avg_overtime"],
+            total_actual_hours=None if suppressed else _safe_float(total_actual),
+            total_overtime_hours=None if suppressed else _safe_float(total_overtime),
+            ci_actual_low=None if suppressed else metrics["ci_actual_low"],
+            ci_actual_high=None if suppressed else metrics["ci_actual_high"],
+            ci_overtime_low=None if suppressed else metrics["ci_overtime_low"],
+            ci_overtime_high=None if suppressed else metrics["ci_overtime_high"],
+            suppressed=suppressed,
+        )
+        # model_construct skips per-row validation — every field above is
+        # already the declared type (dates/enums/floats built right here).
+        if row.hospital_domain is None:
+            staff_group_rows.append(StaffGroupMonthlySummary.model_construct(**common))
+        else:
+            hospital_rows.append(
+                HospitalMonthlySummary.model_construct(
+                    hospital_domain=row.hospital_domain, **common
+                )
+            )
+
+    # Grouping sets interleave, so restore the documented response order here
+    # instead of in SQL (month desc, then names asc; sorts are stable).
+    hospital_rows.sort(key=lambda r: (r.hospital_domain, r.staff_group.value))
+    hospital_rows.sort(key=lambda r: r.month_start, reverse=True)
+    staff_group_rows.sort(key=lambda r: r.staff_group.value)
+    staff_group_rows.sort(key=lambda r: r.month_start, reverse=True)
+    return hospital_rows, staff_group_rows
 
 
 def _compute_metrics(
-    actual_samples: list[float],
-    overtime_samples: list[float],
+    avg_actual: float | None,
+    std_actual: float | None,
+    avg_overtime: float | None,
+    std_overtime: float | None,
     count: int,
     suppressed: bool,
 ) -> dict[str, float | None]:
@@ -184,11 +194,11 @@ def _compute_metrics(
             "ci_overtime_high": None,
         }
 
-    avg_actual = _safe_float(sum(actual_samples) / count)
-    avg_overtime = _safe_float(sum(overtime_samples) / count)
+    ci_actual_low, ci_actual_high = _normal_ci(avg_actual, std_actual, count)
+    ci_overtime_low, ci_overtime_high = _normal_ci(avg_overtime, std_overtime, count)
 
-    ci_actual_low, ci_actual_high = _bootstrap_ci(actual_samples)
-    ci_overtime_low, ci_overtime_high = _bootstrap_ci(overtime_samples)
+    avg_actual = _safe_float(avg_actual)
+    avg_overtime = _safe_float(avg_overtime)
 
     ci_actual_low = _apply_dp(ci_actual_low)
     ci_actual_high = _apply_dp(ci_actual_high)
@@ -216,26 +226,22 @@ def _safe_float(value: float | None) -> float | None:
     return float(round(value, 2))
 
 
-def _to_float_list(values: list | None) -> list[float]:
-    if not values:
-        return []
-    return [float(v) for v in values]
-
+def _normal_ci(
+    mean: float | None,
+    stddev: float | None,
+    count: int,
+) -> tuple[float | None, float | None]:
+    """95% normal-approximation CI of the mean from SQL-side aggregates.
 
-def _bootstrap_ci(samples: list[float], iterations: int = BOOTSTRAP_ITERATIONS, alpha: float = 0.05) -> tuple[float | None, float | None]:
-    if not samples:
+    stddev_samp is NULL for single-row groups; mirror the old behavior
+    of a degenerate (value, value) interval there.
+    """
+    if mean is None:
         return (None, None)
-    if len(samples) == 1:
-        value = samples[0]
-        return (value, value)
-    means: list[float] = []
-    for _ in range(iterations):
-        resample = [random.choice(samples) for _ in range(len(samples))]
-        means.append(sum(resample) / len(resample))
-    means.sort()
-    lower_index = max(int((alpha / 2) * iterations) - 1, 0)
-    upper_index = min(int((1 - alpha / 2) * iterations), iterations - 1)
-    return (means[lower_index], means[upper_index])
+    if stddev is None or count < 2:
+        return (mean, mean)
+    half_width = CI_Z * stddev / math.sqrt(count)
+    return (mean - half_width, mean + half_width)
 
 
 def _apply_dp(value: float | None, scale: float = NOISE_SCALE) -> float | None:
@@ -244,13 +250,27 @@ def _apply_dp(value: float | None, scale: float = NOISE_SCALE) -> float | None:
     return value + _laplace_noise(scale)
 
 
+# Per-thread PRNG: handlers run in the threadpool, and sharing the module
+# -level Mersenne Twister across threads interleaves state between requests.
+_thread_local = threading.local()
+
+
 def _laplace_noise(scale: float) -> float:
-    u = random.random() - 0.5
+    rng = getattr(_thread_local, "rng", None)
+    if rng is None:
+        rng = _thread_local.rng = random.Random()
+    u = rng.random() - 0.5
     return -scale * math.copysign(1.0, u) * math.log(1 - 2 * abs(u))
 
 
 def _months_back_start(months: int) -> date:
-    today = date.today()
+    # Keyed on today's ordinal so the memo self-invalidates at midnight.
+    return _months_back_start_cached(date.today().toordinal(), months)
+
+
+@lru_cache(maxsize=128)
+def _months_back_start_cached(today_ordinal: int, months: int) -> date:
+    today = date.fromordinal(today_ordinal)
     year = today.year
     month = today.month - (months - 1)
     while month <= 0:
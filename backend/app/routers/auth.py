@@ -4,16 +4,20 @@ Part of the Privacy Architecture Redesign (Module 2).
 """
 from __future__ import annotations
 
+import json
 import logging
 import secrets
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, literal, select
 from sqlalchemy.orm import Session
 
 from ..config import get_settings
-from ..database import get_db
+from ..database import SessionLocal, get_db
 from ..dependencies import get_current_user
 from ..dp_group_stats.accounting import user_annual_summary
 from ..models import FeedbackReport, User, VerificationRequest, VerificationStatus, WorkEvent
@@ -26,7 +30,6 @@ from ..schemas import (
     PrivacyBudgetOut,
     SocialAuthStartOut,
     SocialRegisterIn,
-    UserDataExportOut,
     UserLoginIn,
     UserOut,
     UserProfileUpdateIn,
@@ -72,35 +75,33 @@ def register_user(
     email = payload.email.strip().lower()
     email_hash_value = hash_email(email)
 
-    # Check if email has been verified
-    verification = (
-        db.query(VerificationRequest)
-        .filter(VerificationRequest.email_hash == email_hash_value)
-        .filter(VerificationRequest.status == VerificationStatus.confirmed.value)
-        .one_or_none()
-    )
+    # Check if email has been verified — existence only, so select a bare
+    # literal instead of hydrating the full row
+    verified = db.execute(
+        select(literal(1))
+        .where(VerificationRequest.email_hash == email_hash_value)
+        .where(VerificationRequest.status == VerificationStatus.confirmed.value)
+        .limit(1)
+    ).scalar()
 
-    if verification is None:
+    if verified is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email must be verified before registration. Please complete email verification first.",
         )
 
-    # Check if user already exists
-    existing_user = (
-        db.query(User)
-        .filter(User.email_hash == email_hash_value)
-        .one_or_none()
-    )
+    # Check if user already exists (same existence-only pattern)
+    user_exists = db.execute(
+        select(literal(1)).where(User.email_hash == email_hash_value).limit(1)
+    ).scalar()
 
-    if existing_user is not None:
+    if user_exists is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Registration failed. Please verify your email and try again.",
         )
 
     # Create new user with consent data
-    now = datetime.now(timezone.utc)
     new_user = User(
         email_hash=email_hash_value,
         hospital_id=payload.hospital_id,
@@ -117,7 +118,9 @@ def register_user(
         # GDPR consent
         terms_accepted_version=payload.terms_version,
         privacy_accepted_version=payload.privacy_version,
-        consent_accepted_at=now if payload.terms_version else None,
+        # Server-assigned like created_at/updated_at — registration needs no
+        # Python-side clock read at all.
+        consent_accepted_at=func.now() if payload.terms_version else None,
     )
 
     db.add(new_user)
@@ -159,7 +162,6 @@ def login_user(
     """
     email = payload.email.strip().lower()
     email_hash_value = hash_email(email)
-    now = datetime.now(timezone.utc)
 
     # Demo account bypass for Apple App Review
     settings = get_settings()
@@ -191,16 +193,21 @@ def login_user(
                 user_id=user.user_id,
             )
 
-    # Normal verification flow
+    # Normal verification flow — one clock read, reused for the expiry check
+    # and the confirmation timestamp below
+    now = datetime.now(timezone.utc)
     code_hash_value = hash_code(payload.code)
 
-    # Verify the code
-    verification = (
-        db.query(VerificationRequest)
+    # Verify the code and fetch the user in one round trip (users.email_hash
+    # is unique, so the outer join yields at most one row)
+    row = (
+        db.query(VerificationRequest, User)
+        .outerjoin(User, User.email_hash == VerificationRequest.email_hash)
         .filter(VerificationRequest.email_hash == email_hash_value)
         .filter(VerificationRequest.code_hash == code_hash_value)
         .one_or_none()
     )
+    verification, user = row if row is not None else (None, None)
 
     if verification is None:
         raise HTTPException(
@@ -220,13 +227,6 @@ def login_user(
     verification.status = VerificationStatus.confirmed.value
     verification.confirmed_at = now
 
-    # Check if user exists
-    user = (
-        db.query(User)
-        .filter(User.email_hash == email_hash_value)
-        .one_or_none()
-    )
-
     if user is None:
         db.commit()  # Still commit the verification status
         raise HTTPException(
@@ -310,11 +310,54 @@ def get_current_user_info(
     return UserOut.from_orm(current_user)
 
 
-@router.get("/me/export", response_model=UserDataExportOut)
+_EXPORT_BATCH_SIZE = 1000
+
+
+def _iter_user_export(user_id: UUID, profile: dict) -> Iterator[str]:
+    """Stream the export document without materializing every event.
+
+    Uses its own session: the request-scoped one is closed before a
+    streamed body is sent. Events are fetched with yield_per and
+    emitted in batches, so peak memory is O(batch), not O(N).
+    """
+    head = json.dumps(
+        {"exported_at": datetime.now(timezone.utc).isoformat(), "profile": profile}
+    )
+    yield head[:-1] + ', "work_events": ['
+    with SessionLocal() as session:
+        events = (
+            session.query(WorkEvent)
+            .filter(WorkEvent.user_id == user_id)
+            .order_by(WorkEvent.date.desc())
+            .yield_per(_EXPORT_BATCH_SIZE)
+        )
+        first = True
+        batch: list[str] = []
+        for event in events:
+            item = json.dumps(
+                {
+                    "event_id": str(event.event_id),
+                    "date": str(event.date),
+                    "planned_hours": float(event.planned_hours),
+                    "actual_hours": float(event.actual_hours),
+                    "source": event.source,
+                    "submitted_at": event.submitted_at.isoformat() if event.submitted_at else None,
+                }
+            )
+            batch.append(item if first else ", " + item)
+            first = False
+            if len(batch) >= _EXPORT_BATCH_SIZE:
+                yield "".join(batch)
+                batch.clear()
+        if batch:
+            yield "".join(batch)
+    yield "]}"
+
+
+@router.get("/me/export")
 def export_user_data(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(_get_db_session),
-) -> UserDataExportOut:
+) -> StreamingResponse:
     """
     Export all user data (GDPR Art. 20 - Data Portability).
 
@@ -323,51 +366,32 @@ def export_user_data(
     - All work events
 
     Format is structured and machine-readable as required by GDPR.
+    The document matches UserDataExportOut but is streamed in batches
+    so a long event history does not spike server memory.
 
     Requires:
     - Valid JWT token in Authorization header
     """
-    # Re-fetch user in this session
-    user = db.query(User).filter(User.user_id == current_user.user_id).one()
-
-    # Get all work events
-    work_events = (
-        db.query(WorkEvent)
-        .filter(WorkEvent.user_id == user.user_id)
-        .order_by(WorkEvent.date.desc())
-        .all()
-    )
-
-    return UserDataExportOut(
-        exported_at=datetime.now(timezone.utc),
-        profile={
-            "user_id": str(user.user_id),
-            "hospital_id": user.hospital_id,
-            "specialty": user.specialty,
-            "role_level": user.role_level,
-            "state_code": user.state_code,
-            "country_code": user.country_code,
-            "profession": user.profession,
-            "seniority": user.seniority,
-            "department_group": user.department_group,
-            "specialization_code": user.specialization_code,
-            "hospital_ref_id": user.hospital_ref_id,
-            "created_at": user.created_at.isoformat() if user.created_at else None,
-            "terms_accepted_version": user.terms_accepted_version,
-            "privacy_accepted_version": user.privacy_accepted_version,
-            "consent_accepted_at": user.consent_accepted_at.isoformat() if user.consent_accepted_at else None,
-        },
-        work_events=[
-            {
-                "event_id": str(event.event_id),
-                "date": str(event.date),
-                "planned_hours": float(event.planned_hours),
-                "actual_hours": float(event.actual_hours),
-                "source": event.source,
-                "submitted_at": event.submitted_at.isoformat() if event.submitted_at else None,
-            }
-            for event in work_events
-        ],
+    profile = {
+        "user_id": str(current_user.user_id),
+        "hospital_id": current_user.hospital_id,
+        "specialty": current_user.specialty,
+        "role_level": current_user.role_level,
+        "state_code": current_user.state_code,
+        "country_code": current_user.country_code,
+        "profession": current_user.profession,
+        "seniority": current_user.seniority,
+        "department_group": current_user.department_group,
+        "specialization_code": current_user.specialization_code,
+        "hospital_ref_id": current_user.hospital_ref_id,
+        "created_at": current_user.created_at.isoformat() if current_user.created_at else None,
+        "terms_accepted_version": current_user.terms_accepted_version,
+        "privacy_accepted_version": current_user.privacy_accepted_version,
+        "consent_accepted_at": current_user.consent_accepted_at.isoformat() if current_user.consent_accepted_at else None,
+    }
+    return StreamingResponse(
+        _iter_user_export(current_user.user_id, profile),
+        media_type="application/json",
     )
 
 
@@ -493,8 +517,11 @@ def delete_account(
             detail="Demo account cannot be deleted.",
         )
 
-    # Re-fetch user in this session to avoid SQLAlchemy session conflict
-    user = db.query(User).filter(User.user_id == user_id).one()
+    # One transaction, no re-fetch: current_user is attached without a
+    # SELECT, and passive_deletes on the relationships means the user
+    # DELETE does not load every WorkEvent — the DB-level ON DELETE
+    # CASCADE removes them.
+    user = db.merge(current_user, load=False)
 
     # Delete FeedbackReports associated with this user (no FK cascade)
     db.query(FeedbackReport).filter(
@@ -508,7 +535,6 @@ def delete_account(
             VerificationRequest.email_hash == email_hash
         ).delete(synchronize_session=False)
 
-    # Delete user - WorkEvents are cascade deleted automatically
     logger.info(f"User {user_id} deleted account (GDPR Art. 17)")
     db.delete(user)
     db.commit()
@@ -661,7 +687,6 @@ def register_social_user(
         )
 
     # Create full user row — same contract as email registration
-    now = datetime.now(timezone.utc)
     new_user = User(
         email_hash=None,  # Social auth users have no stored email
         auth_provider=identity.provider,
@@ -680,7 +705,7 @@ def register_social_user(
         # GDPR consent
         terms_accepted_version=payload.terms_version,
         privacy_accepted_version=payload.privacy_version,
-        consent_accepted_at=now if payload.terms_version else None,
+        consent_accepted_at=func.now() if payload.terms_version else None,
     )
 
     db.add(new_user)
@@ -9,10 +9,14 @@ privacy protections:
 """
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func
+import hashlib
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from ..database import get_db
@@ -52,6 +56,25 @@ GERMAN_STATES = {
 # Privacy threshold (k-anonymity) — must match dp_group_stats config
 K_MIN = 5
 
+# Response order is by state name; sort the static mapping once at import
+# instead of sorting 16 built models on every cache miss.
+_SORTED_STATES = sorted(GERMAN_STATES.items(), key=lambda item: item[1])
+
+# Both endpoints are public, read-heavy and explicitly stale-tolerant (the
+# coverage response advertises weekly precision), so serve a cached result
+# and hit the database at most once per TTL instead of once per request.
+_COVERAGE_CACHE_TTL_SECONDS = 3600.0
+_ACTIVITY_CACHE_TTL_SECONDS = 1800.0
+_dashboard_cache_lock = threading.Lock()
+# Cached alongside each payload: a strong ETag over the serialized body, so
+# conditional requests (and any CDN in front) can be answered with 304s.
+_coverage_cache: tuple[float, CoverageOut, str] | None = None
+_activity_cache: tuple[float, ActivityOut, str] | None = None
+
+
+def _make_etag(body_json: str) -> str:
+    return f'"{hashlib.sha1(body_json.encode("utf-8")).hexdigest()}"'
+
 
 def _count_to_range(count: int) -> str:
     """
@@ -85,21 +108,34 @@ def _count_to_status(count: int) -> str:
         return "available"
 
 
+# Memoized per calendar day — the Monday truncation only changes on date
+# rollover, so recompute at most once a day instead of per call.
+_weekly_ts: tuple[date, datetime] | None = None
+
+
 def _get_weekly_timestamp() -> datetime:
     """
-    Get timestamp truncated to start of week.
+    Get timestamp truncated to start of week (UTC, timezone-aware).
 
     Privacy protection: Weekly precision prevents timing attacks.
     """
-    now = datetime.utcnow()
-    # Truncate to Monday of current week
-    days_since_monday = now.weekday()
-    monday = now - timedelta(days=days_since_monday)
-    return monday.replace(hour=0, minute=0, second=0, microsecond=0)
+    global _weekly_ts
+    today = datetime.now(timezone.utc).date()
+    cached = _weekly_ts
+    if cached is not None and cached[0] == today:
+        return cached[1]
+    monday = today - timedelta(days=today.weekday())
+    ts = datetime(monday.year, monday.month, monday.day, tzinfo=timezone.utc)
+    _weekly_ts = (today, ts)
+    return ts
 
 
 @router.get("/coverage", response_model=CoverageOut)
-def get_coverage(db: Session = Depends(get_db)) -> CoverageOut:
+def get_coverage(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+) -> CoverageOut | Response:
     """
     Get coverage status for the public dashboard map.
 
@@ -111,22 +147,42 @@ def get_coverage(db: Session = Depends(get_db)) -> CoverageOut:
     - Timestamp at weekly precision only
     - No individual-level data exposed
     """
-    # Count distinct users per state
-    state_counts = (
-        db.query(
-            User.state_code,
-            func.count(User.user_id).label("count")
-        )
-        .filter(User.state_code.isnot(None))
-        .group_by(User.state_code)
-        .all()
-    )
-
-    state_count_map = {row.state_code: row.count for row in state_counts}
-
-    # Build state coverage list
+    global _coverage_cache
+    with _dashboard_cache_lock:
+        cached = _coverage_cache
+    if cached is not None and time.monotonic() - cached[0] < _COVERAGE_CACHE_TTL_SECONDS:
+        result, etag = cached[1], cached[2]
+    else:
+        result = _compute_coverage(db)
+        etag = _make_etag(result.model_dump_json())
+        with _dashboard_cache_lock:
+            _coverage_cache = (time.monotonic(), result, etag)
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=3600, stale-while-revalidate=86400",
+        "Last-Modified": format_datetime(result.updated_at, usegmt=True),
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return result
+
+
+def _compute_coverage(db: Session) -> CoverageOut:
+    # One grouped scan covers both the per-state counts and the national
+    # total: grouping WITHOUT the state filter keeps users with no state
+    # (NULL group), so the total is just the sum over all groups.
+    state_counts = db.execute(
+        select(User.state_code, func.count(User.user_id)).group_by(User.state_code)
+    ).all()
+
+    state_count_map = {code: count for code, count in state_counts}
+    total_users = sum(state_count_map.values())
+
+    # Build state coverage list (already in response order)
     states = []
-    for state_code, state_name in GERMAN_STATES.items():
+    for state_code, state_name in _SORTED_STATES:
         count = state_count_map.get(state_code, 0)
         states.append(StateCoverageOut(
             state_code=state_code,
@@ -136,12 +192,6 @@ def get_coverage(db: Session = Depends(get_db)) -> CoverageOut:
             threshold=K_MIN,
         ))
 
-    # Sort by state name
-    states.sort(key=lambda s: s.state_name)
-
-    # National total
-    total_users = db.query(func.count(User.user_id)).scalar() or 0
-
     national = StateCoverageOut(
         state_code="DEU",
         state_name="Deutschland",
@@ -160,7 +210,11 @@ def get_coverage(db: Session = Depends(get_db)) -> CoverageOut:
 
 
 @router.get("/activity", response_model=ActivityOut)
-def get_activity(db: Session = Depends(get_db)) -> ActivityOut:
+def get_activity(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+) -> ActivityOut | Response:
     """
     Get 30-day rolling activity for the public dashboard.
 
@@ -173,39 +227,53 @@ def get_activity(db: Session = Depends(get_db)) -> ActivityOut:
     - Contributor count as range
     - Shift count is exact (aggregate, not identifying)
     """
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-
-    # Count distinct users who submitted in last 30 days
-    active_contributors = (
-        db.query(func.count(func.distinct(WorkEvent.user_id)))
-        .filter(WorkEvent.submitted_at >= thirty_days_ago)
-        .scalar()
-    ) or 0
-
-    # Count total shifts (work events) in last 30 days
-    shifts_confirmed = (
-        db.query(func.count(WorkEvent.event_id))
-        .filter(WorkEvent.submitted_at >= thirty_days_ago)
-        .scalar()
-    ) or 0
-
-    # Count states by coverage status
-    state_counts = (
-        db.query(
-            User.state_code,
-            func.count(User.user_id).label("count")
-        )
-        .filter(User.state_code.isnot(None))
+    global _activity_cache
+    with _dashboard_cache_lock:
+        cached = _activity_cache
+    if cached is not None and time.monotonic() - cached[0] < _ACTIVITY_CACHE_TTL_SECONDS:
+        result, etag = cached[1], cached[2]
+    else:
+        result = _compute_activity(db)
+        etag = _make_etag(result.model_dump_json())
+        with _dashboard_cache_lock:
+            _activity_cache = (time.monotonic(), result, etag)
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=1800",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return result
+
+
+def _compute_activity(db: Session) -> ActivityOut:
+    thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
+
+    # Both 30-day counts share the same predicate, so compute them in one
+    # scan / one round trip instead of two separate queries
+    shifts_confirmed, active_contributors = db.execute(
+        select(
+            func.count(WorkEvent.event_id),
+            func.count(func.distinct(WorkEvent.user_id)),
+        ).where(WorkEvent.submitted_at >= thirty_days_ago)
+    ).one()
+
+    # Count states by coverage status (Core select — plain tuples, no ORM
+    # hydration, matching the queries above)
+    state_counts = db.execute(
+        select(User.state_code, func.count(User.user_id))
+        .where(User.state_code.is_not(None))
         .group_by(User.state_code)
-        .all()
-    )
+    ).all()
 
     states_building = 0
     states_available = 0
-    for row in state_counts:
-        if row.count >= K_MIN:
+    for _state_code, count in state_counts:
+        if count >= K_MIN:
             states_available += 1
-        elif row.count > 0:
+        elif count > 0:
             states_building += 1
 
     return ActivityOut(
@@ -220,6 +288,7 @@ def get_activity(db: Session = Depends(get_db)) -> ActivityOut:
 @router.post("/contact", response_model=InstitutionInquiryOut)
 def submit_institution_inquiry(
     inquiry: InstitutionInquiryIn,
+    background: BackgroundTasks,
     db: Session = Depends(get_db),
     _rl: None = Depends(rate_limit(5, 3600)),
 ) -> InstitutionInquiryOut:
@@ -242,8 +311,10 @@ def submit_institution_inquiry(
     db.commit()
     db.refresh(db_inquiry)
 
-    # Send email notification to admin
-    send_inquiry_notification(
+    # Notify admin after the response is sent — the client shouldn't wait
+    # on SMTP round-trips (same pattern as /verification/request)
+    background.add_task(
+        send_inquiry_notification,
         inquiry_id=db_inquiry.inquiry_id,
         name=inquiry.name,
         organization=inquiry.organization,
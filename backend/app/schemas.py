@@ -19,10 +19,6 @@ from .taxonomy import (
 class VerificationRequestIn(BaseModel):
     email: EmailStr
 
-    @validator("email")
-    def _lowercase_email(cls, value: str) -> str:
-        return value.lower()
-
 
 class VerificationRequestOut(BaseModel):
     message: str
@@ -32,10 +28,6 @@ class VerificationConfirmIn(BaseModel):
     email: EmailStr | None = None  # Optional for backwards compat with old app versions
     code: str = Field(..., min_length=6, max_length=128)
 
-    @validator("email", pre=True)
-    def _lowercase_email(cls, value: str | None) -> str | None:
-        return value.lower() if value else None
-
 
 class VerificationConfirmOut(BaseModel):
     affiliation_token: str
@@ -199,10 +191,6 @@ class UserRegisterIn(BaseModel):
     terms_version: str | None = Field(default=None, max_length=20)
     privacy_version: str | None = Field(default=None, max_length=20)
 
-    @validator("email")
-    def _lowercase_email(cls, value: str) -> str:
-        return value.lower()
-
     @validator("profession")
     def _validate_profession(cls, value: str | None) -> str | None:
         if value is not None and value not in [p.value for p in Profession]:
@@ -247,10 +235,6 @@ class UserLoginIn(BaseModel):
     email: EmailStr
     code: str = Field(..., min_length=6, max_length=128)
 
-    @validator("email")
-    def _lowercase_email(cls, value: str) -> str:
-        return value.lower()
-
 
 class AuthTokenOut(BaseModel):
     """Authentication response with JWT token."""
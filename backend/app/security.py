@@ -5,12 +5,20 @@ import hmac
 import secrets
 from datetime import datetime, timedelta, timezone
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 
 from .config import get_settings
 
 settings = get_settings()
 
+# Hot-path constants: these settings are immutable for the process lifetime,
+# so the per-call Pydantic attribute walk and secret re-encode are done once.
+_EMAIL_HASH_SECRET = settings.security.email_hash_secret.encode("utf-8")
+_TOKEN_EXP_HOURS = settings.security.token_exp_hours
+# Pre-built HMAC key object: jose otherwise re-parses the raw secret into a
+# Key instance on every encode/decode.
+_SIGNING_KEY = jwk.construct(settings.security.secret_key, "HS256")
+
 
 def generate_code(length: int = 32) -> str:
     """Generate URL-safe token (for legacy compatibility)"""
@@ -23,15 +31,16 @@ def generate_numeric_code(length: int = 6) -> str:
 
 
 def hash_email(email: str) -> str:
-    secret = settings.security.email_hash_secret.encode("utf-8")
-    digest = hmac.new(secret, email.encode("utf-8"), "sha256").digest()
-    return base64.urlsafe_b64encode(digest).decode("utf-8").rstrip("=")
+    # hmac.digest is the one-shot C path (no HMAC object, OpenSSL-backed).
+    digest = hmac.digest(_EMAIL_HASH_SECRET, email.encode("utf-8"), "sha256")
+    # Strip the base64 padding on bytes; a 32-byte digest always pads to 44
+    # chars, so this never scans more than the trailing "=".
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
 
 
 def hash_code(code: str) -> str:
-    secret = settings.security.email_hash_secret.encode("utf-8")
-    digest = hmac.new(secret, code.encode("utf-8"), "sha256").digest()
-    return base64.urlsafe_b64encode(digest).decode("utf-8").rstrip("=")
+    digest = hmac.digest(_EMAIL_HASH_SECRET, code.encode("utf-8"), "sha256")
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
 
 
 # Affiliation tokens have no refresh mechanism and keep their original 30-day
@@ -47,13 +56,13 @@ def create_affiliation_token(*, hospital_domain: str) -> tuple[str, datetime]:
         "exp": expire,
         "scope": "report:submit",
     }
-    token = jwt.encode(payload, settings.security.secret_key, algorithm="HS256")
+    token = jwt.encode(payload, _SIGNING_KEY, algorithm="HS256")
     return token, expire
 
 
 def verify_affiliation_token(token: str) -> str | None:
     try:
-        payload = jwt.decode(token, settings.security.secret_key, algorithms=["HS256"])
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=["HS256"])
     except JWTError:
         return None
     return payload.get("hd")
@@ -80,7 +89,7 @@ def create_user_access_token(
     stolen token cannot be renewed forever.
     """
     now = datetime.now(timezone.utc)
-    expire = now + timedelta(hours=settings.security.token_exp_hours)
+    expire = now + timedelta(hours=_TOKEN_EXP_HOURS)
     if max_expires_at is not None and expire > max_expires_at:
         # Refresh clamps expiry to the chain deadline (auth_time + max session
         # age) so the FINAL token of a chain also dies at the deadline — the
@@ -92,14 +101,14 @@ def create_user_access_token(
         "type": "access",
         "auth_time": int((auth_time or now).timestamp()),
     }
-    token = jwt.encode(payload, settings.security.secret_key, algorithm="HS256")
+    token = jwt.encode(payload, _SIGNING_KEY, algorithm="HS256")
     return token, expire
 
 
 def get_token_auth_time(token: str) -> datetime | None:
     """Read the auth_time claim from a valid token (None if absent/invalid)."""
     try:
-        payload = jwt.decode(token, settings.security.secret_key, algorithms=["HS256"])
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=["HS256"])
     except JWTError:
         return None
     ts = payload.get("auth_time")
@@ -114,7 +123,7 @@ def verify_user_access_token(token: str) -> str | None:
     Returns None if token is invalid or expired.
     """
     try:
-        payload = jwt.decode(token, settings.security.secret_key, algorithms=["HS256"])
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=["HS256"])
         if payload.get("type") != "access":
             return None
         user_id: str | None = payload.get("sub")
@@ -13,7 +13,7 @@ from datetime import datetime, timedelta, timezone
 from typing import NamedTuple
 
 import httpx
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 from jose.backends import RSAKey
 
 from .config import get_settings
@@ -32,6 +32,9 @@ _KEY_CACHE_TTL = 3600  # 1 hour
 # Social registration token expiry
 SOCIAL_REGISTRATION_TOKEN_EXPIRY_MINUTES = 30
 
+# Pre-built HMAC key object (jose re-parses raw string keys per call).
+_REGISTRATION_SIGNING_KEY = jwk.construct(get_settings().security.secret_key, "HS256")
+
 
 class ProviderIdentity(NamedTuple):
     """Verified identity from a social auth provider."""
@@ -184,7 +187,6 @@ def create_social_registration_token(*, provider: str, sub: str) -> str:
     needs to complete registration. It's NOT a session token — it only proves
     the user authenticated with the provider.
     """
-    settings = get_settings()
     expire = datetime.now(timezone.utc) + timedelta(minutes=SOCIAL_REGISTRATION_TOKEN_EXPIRY_MINUTES)
     payload = {
         "provider": provider,
@@ -192,7 +194,7 @@ def create_social_registration_token(*, provider: str, sub: str) -> str:
         "exp": expire,
         "type": "social_registration",
     }
-    return jwt.encode(payload, settings.security.secret_key, algorithm="HS256")
+    return jwt.encode(payload, _REGISTRATION_SIGNING_KEY, algorithm="HS256")
 
 
 def verify_social_registration_token(token: str) -> ProviderIdentity:
@@ -205,9 +207,8 @@ def verify_social_registration_token(token: str) -> ProviderIdentity:
     Raises:
         ProviderVerificationError on invalid/expired token
     """
-    settings = get_settings()
     try:
-        payload = jwt.decode(token, settings.security.secret_key, algorithms=["HS256"])
+        payload = jwt.decode(token, _REGISTRATION_SIGNING_KEY, algorithms=["HS256"])
         if payload.get("type") != "social_registration":
             raise ProviderVerificationError("Invalid token type")
         provider = payload.get("provider")
@@ -13,7 +13,7 @@ os.environ.setdefault("ADMIN_PASSWORD", "test-admin-password")
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -38,6 +38,13 @@ def test_db() -> Generator[Session, None, None]:
         poolclass=StaticPool,
     )
 
+    # Enforce FKs like production Postgres (ON DELETE CASCADE paths)
+    @event.listens_for(engine, "connect")
+    def _enable_sqlite_fks(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
     # Create all tables
     Base.metadata.create_all(bind=engine)
 
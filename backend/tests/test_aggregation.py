@@ -942,3 +942,45 @@ def test_aggregation_excludes_demo_users(test_db):
     demo_ids = {u.user_id for u in test_db.query(User).filter(User.is_demo.is_(True))}
     assert len(per_user) == 5
     assert all(uid not in demo_ids for uid, _ in per_user)
+
+
+def test_backfill_matches_sequential_per_week_runs(test_db):
+    """Backfill over a range must reproduce the per-week policy progression."""
+    from app.aggregation import backfill_aggregates_by_state_specialty
+    from app.models import StateSpecialtyReleaseCell, StatsByStateSpecialty, User
+
+    test_db.add(StateSpecialtyReleaseCell(country_code="DEU", state_code="BY", specialty="surgery"))
+    test_db.flush()
+
+    users = []
+    for i in range(6):
+        user = User(
+            email_hash=f"hash_backfill_{i}",
+            hospital_id="test-hospital",
+            specialty="surgery",
+            role_level="specialist",
+            state_code="BY",
+            hospital_ref_id=300 + i,
+        )
+        test_db.add(user)
+        test_db.flush()
+        users.append(user)
+    test_db.commit()
+
+    for week_start in (date(2025, 12, 1), date(2025, 12, 8), date(2025, 12, 15)):
+        _add_finalized_weeks(test_db, users, week_start)
+
+    published = backfill_aggregates_by_state_specialty(
+        test_db, date(2025, 12, 1), date(2025, 12, 21)
+    )
+
+    # Week 1 warms up, weeks 2 and 3 publish (activation_weeks=2).
+    assert published == 2
+    stats = {
+        stat.period_start: stat
+        for stat in test_db.query(StatsByStateSpecialty).all()
+    }
+    assert stats[date(2025, 12, 1)].publication_status == PublicationStatus.warming_up.value
+    assert stats[date(2025, 12, 8)].publication_status == PublicationStatus.published.value
+    assert stats[date(2025, 12, 15)].publication_status == PublicationStatus.published.value
+    assert all(stat.n_users == 6 for stat in stats.values())
@@ -266,3 +266,46 @@ class TestRightToErasure:
         # Verify work events were cascade deleted
         work_events_after = test_db.query(WorkEvent).filter(WorkEvent.user_id == user_id).count()
         assert work_events_after == 0
+
+
+@pytest.mark.integration
+class TestBulkInsertWorkEvents:
+    """Test the single-statement batch insert helper."""
+
+    def test_bulk_insert_skips_existing_days(
+        self, client: TestClient, auth_headers: dict[str, str], test_db: Session
+    ):
+        """Conflicting (user_id, date) rows are skipped, new rows land."""
+        from app.models import User, bulk_insert_work_events
+
+        # One event created through the API...
+        existing = {
+            "date": "2025-12-09",
+            "planned_hours": 8.0,
+            "actual_hours": 9.5,
+            "source": "geofence",
+        }
+        response = client.post("/work-events", json=existing, headers=auth_headers)
+        assert response.status_code == 201
+
+        user_id = test_db.query(User.user_id).scalar()
+
+        # ...then a batch containing that day plus two new ones.
+        batch = [
+            {
+                "user_id": user_id,
+                "date": date(2025, 12, day),
+                "planned_hours": 8.0,
+                "actual_hours": 8.0,
+                "source": "manual",
+            }
+            for day in (9, 10, 11)
+        ]
+        inserted = bulk_insert_work_events(test_db, batch)
+        test_db.commit()
+
+        assert inserted == 2
+        events = test_db.query(WorkEvent).order_by(WorkEvent.date).all()
+        assert [event.date.day for event in events] == [9, 10, 11]
+        # The pre-existing day was not overwritten.
+        assert float(events[0].actual_hours) == 9.5